@@ -0,0 +1,48 @@
+"""Per-element vs single-script extraction of people-search result cards.
+
+Needs a local headless browser. Run from CrewAIApps/:
+    python -m benchmarks.bench_dom_extraction --browser firefox --cards 10 --repeats 20
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("LINKEDIN_COOKIE", "benchmark")
+
+from benchmarks.fixtures import PeopleSearchHandler, local_server
+from recruitment.tools.browser_pool import BrowserPool
+from recruitment.tools.client import RESULT_CARD_SELECTOR, Client
+
+
+def timed(label, fn, repeats):
+    fn()  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeats):
+        people = fn()
+    elapsed = (time.perf_counter() - started) / repeats
+    print(f"{label:<14} {elapsed * 1000:8.2f} ms/page  ({len(people)} people)")
+    return people
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--browser", default="chrome", choices=["chrome", "firefox"])
+    parser.add_argument("--cards", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    with local_server(PeopleSearchHandler) as base_url:
+        pool = BrowserPool(f"{base_url}/?cards=0", browser=args.browser, size=1)
+        client = Client(pool=pool)
+        try:
+            client.driver.navigate(f"{base_url}/?cards={args.cards}", ready_selector=RESULT_CARD_SELECTOR)
+            per_element = timed("per-element", client.extract_people_per_element, args.repeats)
+            batch = timed("batch script", client.extract_people_batch, args.repeats)
+            assert per_element == batch, "batch and per-element extraction disagree"
+        finally:
+            client.close()
+            pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
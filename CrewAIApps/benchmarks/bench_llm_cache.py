@@ -0,0 +1,67 @@
+"""LLM response cache, through ``RoutedLLM``, against a fake local LLM with fixed latency.
+
+Run from CrewAIApps/:
+    python -m benchmarks.bench_llm_cache --prompts 50 --latency 0.2 --semantic
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from crewai import BaseLLM
+
+from services.llm_cache import LLMResponseCache
+from services.model_router import ModelRouter
+from services.routed_llm import RoutedLLM
+
+
+class SlowFakeLLM(BaseLLM):
+    """Echoes the prompt after ``latency`` seconds; stands in for the API."""
+
+    latency: float = 0.2
+    temperature: float = 0.0
+    calls: int = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None,
+             response_model=None, **kwargs) -> str:
+        self.calls += 1
+        time.sleep(self.latency)
+        return f"Answer to: {messages}"
+
+
+def timed(label, llm, prompts):
+    started = time.perf_counter()
+    for prompt in prompts:
+        llm.call([{"role": "system", "content": "You are a financial analyst."}, {"role": "user", "content": prompt}])
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed / len(prompts) * 1000:9.2f} ms/prompt")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--semantic", action="store_true")
+    args = parser.parse_args()
+
+    prompts = [f"Summarise the quarterly outlook for ticker number {i}." for i in range(args.prompts)]
+    rephrased = [f"summarise the quarterly outlook for ticker number {i}" for i in range(args.prompts)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = LLMResponseCache(Path(cache_dir) / "llm.sqlite3", semantic=args.semantic)
+        inner = SlowFakeLLM(model="fake-llm", latency=args.latency)
+        router = ModelRouter({"bench": {"model": "fake-llm", "fallback": None}}, {})
+        llm = RoutedLLM(route="bench", router=router, factory=lambda model: inner, cache=cache, bypass=False)
+
+        timed("cold (miss)", llm, prompts)
+        timed("warm (exact hit)", llm, prompts)
+        timed("rephrased", llm, rephrased)
+        llm.bypass = True
+        timed("bypass", llm, prompts)
+        print(f"inner calls: {inner.calls}")
+        print(cache.stats())
+        print(router.stats()["bench"]["models"]["fake-llm"]["count"], "routed calls recorded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Per-call latency with a new OpenAI client per call vs the shared pooled client.
+
+Uses a local OpenAI-compatible stub, so the numbers show client construction
+and connection setup (no TLS here, which makes reuse matter even more against
+api.openai.com). Run from CrewAIApps/:
+    python -m benchmarks.bench_openai_clients --calls 200 --threads 8
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import openai
+
+from benchmarks.fixtures import OpenAIStubHandler, local_server
+from services.openai_clients import OpenAIClientRegistry
+from services.stats import percentile
+
+MESSAGES = [{"role": "user", "content": "Suggest questions about AAPL."}]
+
+
+def call_fresh(base_url):
+    # What each Streamlit rerun did before: a brand-new client and connection pool.
+    client = openai.OpenAI(api_key="benchmark", base_url=base_url)
+    try:
+        return client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+    finally:
+        client.close()
+
+
+def run(label, call, calls, threads):
+    latencies = []
+
+    def timed(_):
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(timed, range(calls)))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<14} p50 {percentile(latencies, 0.5) * 1000:7.2f} ms  "
+        f"p95 {percentile(latencies, 0.95) * 1000:7.2f} ms  "
+        f"{calls / elapsed:8.1f} calls/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01, help="stub server think time per call")
+    args = parser.parse_args()
+
+    OpenAIStubHandler.latency = args.latency
+    with local_server(OpenAIStubHandler) as server_url:
+        base_url = f"{server_url}/v1"
+        registry = OpenAIClientRegistry()
+        pooled = registry.get(api_key="benchmark", base_url=base_url)
+
+        run("fresh client", lambda: call_fresh(base_url), args.calls, args.threads)
+        run("pooled client", lambda: pooled.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES),
+            args.calls, args.threads)
+        print(registry.limiter.stats())
+        registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Local BM25 pre-scoring of synthetic candidate pools.
+
+Run from CrewAIApps/:
+    python -m benchmarks.bench_scoring --sizes 1000 10000 100000
+"""
+import argparse
+import random
+import time
+
+from recruitment.scoring import rank_candidates
+
+JOB = {
+    "title": "Ruby on Rails and React Engineer",
+    "description": "Build high-quality web applications across backend and frontend.",
+    "responsibilities": "- Develop and maintain web applications using Ruby on Rails and React.",
+    "requirements": "- Ruby on Rails, React, JavaScript, HTML, CSS, SQL, Git.",
+    "preferred_qualifications": "- AWS, Docker, Kubernetes, GraphQL.",
+}
+SKILLS = [
+    "ruby", "rails", "react", "javascript", "typescript", "python", "django", "java", "spring",
+    "go", "rust", "sql", "postgresql", "aws", "docker", "kubernetes", "graphql", "node.js", "c++",
+]
+TITLES = ["Software Engineer", "Senior Engineer", "Full Stack Developer", "Backend Engineer", "Frontend Developer"]
+CITIES = ["Berlin", "London", "New York", "Lisbon", "Toronto", "Remote"]
+
+
+def synthetic_pool(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"Candidate {i}",
+            "position": f"{rng.choice(TITLES)} ({', '.join(rng.sample(SKILLS, 2))})",
+            "location": rng.choice(CITIES),
+            "skills": ", ".join(rng.sample(SKILLS, rng.randint(2, 6))),
+            "profile_link": f"https://www.linkedin.com/in/candidate-{i}",
+        }
+        for i in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        pool = synthetic_pool(size)
+        timings = []
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            ranked = rank_candidates(JOB, pool, args.top)
+            timings.append(time.perf_counter() - started)
+        best = min(timings)
+        print(
+            f"{size:>7} candidates  {best * 1000:9.1f} ms  "
+            f"{size / best:>10.0f} candidates/s  top score {ranked[0][0]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
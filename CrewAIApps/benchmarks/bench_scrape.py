@@ -0,0 +1,54 @@
+"""Compare naive per-call scraping with the pooled, cached ScrapeBackend.
+
+Run from CrewAIApps/:  python -m benchmarks.bench_scrape --pages 50 --repeats 3
+"""
+import argparse
+import time
+
+import requests
+
+from benchmarks.fixtures import StaticSiteHandler, local_server
+from services.scrape_backend import ScrapeBackend, html_to_text
+
+
+def naive(urls):
+    # What one ScrapeWebsiteTool call per URL amounts to: new connection, full parse.
+    for url in urls:
+        html_to_text(requests.get(url, timeout=15).text)
+
+
+def timed(label, fn, calls):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms  {elapsed / calls * 1000:7.2f} ms/page")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=3, help="times each URL is scraped, as by several agents")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    with local_server(StaticSiteHandler) as base_url:
+        urls = [f"{base_url}/page/{n}" for n in range(args.pages)]
+        workload = urls * args.repeats
+        calls = len(workload)
+
+        timed("naive sequential", lambda: naive(workload), calls)
+
+        backend = ScrapeBackend()
+        timed("backend sequential (cold+warm)", lambda: [backend.fetch(url) for url in workload], calls)
+
+        backend = ScrapeBackend()
+        timed("backend fetch_many (cold)", lambda: backend.fetch_many(urls, args.workers), len(urls))
+        timed("backend fetch_many (warm)", lambda: backend.fetch_many(urls, args.workers), len(urls))
+
+        backend.fresh_seconds = 0
+        timed("backend fetch_many (revalidate)", lambda: backend.fetch_many(urls, args.workers), len(urls))
+        print(backend.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Import cost of the app's startup path, per module, cold and warm.
+
+Each repeat runs a fresh interpreter with ``-X importtime``: streamlit is
+imported first (untimed, every page needs it), then the modules crewapp.py
+may load. Cold is that first import; warm is importing them again in the
+same process, which is what every Streamlit rerun pays. Exits non-zero if
+the best cold startup exceeds the budget.
+
+Run from CrewAIApps/:
+    python -m benchmarks.bench_startup --budget-ms 250
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from os import environ as env
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent.parent
+STARTUP_MODULES = ["config", "services.model_router", "tab1_chatbot", "tab2_financial_analysis", "tab3_recruitment"]
+# Deferred until a tab actually runs a crew; shown for reference, not budgeted.
+DEFERRED_MODULES = ["recruitment.crew", "crewai", "langchain.llms"]
+STARTUP_BUDGET_MS = float(env.get("STARTUP_BUDGET_MS", 250))
+MARKER = "-- measure --"
+
+PROBE = """
+import json, sys, time
+for name in {preload!r}:
+    exec("import " + name)
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+cold, warm = {{}}, {{}}
+# Plain import statements: -X importtime omits the outermost module of importlib.import_module.
+for name in {modules!r}:
+    started = time.perf_counter()
+    exec("import " + name)
+    cold[name] = time.perf_counter() - started
+for name in {modules!r}:
+    started = time.perf_counter()
+    exec("import " + name)
+    warm[name] = time.perf_counter() - started
+print(json.dumps({{"cold": cold, "warm": warm}}))
+"""
+
+
+def parse_importtime(stderr: str, max_depth: int = 1):
+    """Imports after the marker, down to ``max_depth``, as ``{module: cumulative_seconds}``."""
+    lines = stderr.split(MARKER, 1)[-1].splitlines()
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if not cumulative.strip().isdigit() or depth > max_depth:
+            continue  # header row or deeply nested import
+        modules[name.strip()] = int(cumulative) / 1e6
+    return modules
+
+
+def probe(modules, preload=("streamlit",)):
+    environment = dict(os.environ)
+    environment.setdefault("OPENAI_API_KEY", "benchmark")
+    environment.setdefault("SERPER_API_KEY", "benchmark")
+    code = PROBE.format(preload=list(preload), marker=MARKER, modules=list(modules))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, env=environment, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    return timings["cold"], timings["warm"], parse_importtime(completed.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--deferred", action="store_true", help="also time the modules lazy loading defers")
+    args = parser.parse_args()
+
+    runs = [probe(STARTUP_MODULES) for _ in range(args.repeats)]
+    cold, warm, breakdown = min(runs, key=lambda run: sum(run[0].values()))
+    print(f"{'module':<28} {'cold ms':>9} {'warm ms':>9}")
+    for name in STARTUP_MODULES:
+        print(f"{name:<28} {cold[name] * 1000:9.1f} {warm[name] * 1000:9.3f}")
+    total = sum(cold.values()) * 1000
+    print(f"{'startup total':<28} {total:9.1f} {sum(warm.values()) * 1000:9.3f}")
+
+    print("\nSlowest imports and their direct dependencies (cumulative):")
+    for name, seconds in sorted(breakdown.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<40} {seconds * 1000:9.1f} ms")
+
+    if args.deferred:
+        print("\nDeferred until first use:")
+        for name in DEFERRED_MODULES:
+            try:
+                deferred, _, _ = probe([name])
+                print(f"  {name:<40} {deferred[name] * 1000:9.1f} ms")
+            except RuntimeError as e:
+                print(f"  {name:<40} failed: {e}")
+
+    if total > args.budget_ms:
+        print(f"\nFAIL: startup {total:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print(f"\nOK: startup {total:.1f} ms within budget {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
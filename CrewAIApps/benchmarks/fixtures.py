@@ -0,0 +1,132 @@
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@contextmanager
+def local_server(handler_class):
+    """Run ``handler_class`` on 127.0.0.1 in a background thread; yields the base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # keep-alive responses would otherwise hit delayed-ACK stalls
+    latency = 0.0  # simulated server think time per request
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body: bytes, content_type: str, status: int = 200, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StaticSiteHandler(QuietHandler):
+    """Serves ``/page/<n>`` HTML pages with ETags and honours If-None-Match."""
+
+    latency = 0.02
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        number = self.path.rsplit("/", 1)[-1]
+        body = (
+            f"<html><head><title>Page {number}</title><style>p {{}}</style></head>"
+            f"<body><h1>Quarterly report {number}</h1>"
+            + "".join(f"<p>Paragraph {i} of page {number} about market trends.</p>" for i in range(200))
+            + "<script>var tracking = 1;</script></body></html>"
+        ).encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_body(body, "text/html; charset=utf-8", headers={"ETag": etag})
+
+
+class SerperStubHandler(QuietHandler):
+    """Stands in for google.serper.dev: POST /search returns canned organic results."""
+
+    latency = 0.05
+
+    def do_POST(self):
+        time.sleep(self.latency)
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        query = payload.get("q", "")
+        results = [
+            {"title": f"{query} result {i}", "link": f"https://example.com/{i}", "snippet": f"About {query}."}
+            for i in range(payload.get("num", 10))
+        ]
+        self.send_body(json.dumps({"organic": results}).encode(), "application/json")
+
+
+class PeopleSearchHandler(QuietHandler):
+    """A static page shaped like LinkedIn people-search results; ``/?cards=N``."""
+
+    def do_GET(self):
+        cards = 10
+        if "cards=" in self.path:
+            cards = int(self.path.split("cards=", 1)[1].split("&", 1)[0])
+        items = "".join(
+            f"""<li><div><div class="linked-area">
+              <span class="entity-result__title-line">Candidate {i}</span>
+              <div class="entity-result__primary-subtitle">Senior Engineer {i}</div>
+              <div class="entity-result__secondary-subtitle">City {i % 7}</div>
+              <a class="app-aware-link" href="https://www.linkedin.com/in/candidate-{i}">Profile</a>
+            </div></div></li>"""
+            for i in range(cards)
+        )
+        empty = "" if cards else '<div class="search-reusable-search-no-results">No results found</div>'
+        body = f"<html><body><ul>{items}</ul>{empty}</body></html>".encode()
+        self.send_body(body, "text/html; charset=utf-8")
+
+
+class OpenAIStubHandler(QuietHandler):
+    """OpenAI-compatible /v1/chat/completions and /v1/embeddings with fixed think time."""
+
+    latency = 0.01
+
+    def do_POST(self):
+        time.sleep(self.latency)
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        model = payload.get("model", "stub")
+        if self.path.endswith("/embeddings"):
+            inputs = payload.get("input", [])
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            body = {
+                "object": "list",
+                "model": model,
+                "data": [{"object": "embedding", "index": i, "embedding": [0.0] * 8} for i in range(len(inputs))],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            }
+        else:
+            body = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "1. What changed?\n2. Why?"},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            }
+        self.send_body(json.dumps(body).encode(), "application/json")
@@ -0,0 +1,219 @@
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from os import environ as env
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_DISK_DIR = Path(__file__).parent.parent / ".cache" / "extractions"
+
+
+def content_key(kind: str, data: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(kind.encode())
+    digest.update(b"\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _sizeof(value) -> int:
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ExtractionCache:
+    """Content-addressed cache of extracted document text.
+
+    Entries are sequences recorded as they stream. They live in an in-memory
+    LRU bounded by ``max_bytes``, which only takes sequences of up to
+    ``max_entry_bytes``; when ``disk_dir`` is set every sequence is also
+    pickled there item by item, so it survives process restarts and is
+    never held in memory whole.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir=None, max_entry_bytes: int = None):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 4 if max_entry_bytes is None else max_entry_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries = OrderedDict()  # key -> (items, size)
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def iter_through(self, kind: str, data: bytes, produce):
+        """Replay a cached sequence, or record ``produce(data)`` as it is consumed.
+
+        A sequence is only stored once the consumer has exhausted it.
+        """
+        key = content_key(kind, data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is not None:
+            yield from entry[0]
+            return
+
+        source = self._read_disk(key)
+        writer = None
+        with self._lock:
+            if source is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+        if source is None:
+            source = produce(data)
+            writer = self._disk_writer(key)
+
+        items, size = [], 0  # kept for the memory tier while the sequence stays small enough
+        completed = False
+        try:
+            for item in source:
+                if writer is not None:
+                    writer.write(item)
+                if items is not None:
+                    size += _sizeof(item)
+                    if size > self.max_entry_bytes:
+                        items = None
+                    else:
+                        items.append(item)
+                yield item
+            completed = True
+        finally:
+            if writer is not None:
+                writer.close(commit=completed)
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+        if items is not None:
+            with self._lock:
+                self._store(key, items)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    # ===== Internals =====
+    def _store(self, key, items):
+        # Caller holds the lock.
+        size = _sizeof(items)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous[1]
+        self._entries[key] = (items, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self.evictions += 1
+
+    def _disk_path(self, key):
+        return self.disk_dir / key[:2] / f"{key}.pkls"
+
+    def _read_disk(self, key):
+        """An iterator over a stored sequence, or None if there is none."""
+        if not self.disk_dir:
+            return None
+        try:
+            f = open(self._disk_path(key), "rb")
+        except OSError:
+            return None
+        return _unpickle_items(f)
+
+    def _disk_writer(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            return _ItemWriter(self._disk_path(key))
+        except OSError as e:
+            print(f"Extraction cache write failed: {e}")
+            return None
+
+
+def _unpickle_items(f):
+    with f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+class _ItemWriter:
+    """Pickles items one after another into a temp file, renamed into place on commit."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        self._file = open(self.tmp_path, "wb")
+
+    def write(self, item):
+        if self._file is None:
+            return
+        try:
+            pickle.dump(item, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Extraction cache write failed: {e}")
+            self.close(commit=False)
+
+    def close(self, commit: bool):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            if commit:
+                os.replace(self.tmp_path, self.path)
+            else:
+                os.unlink(self.tmp_path)
+        except OSError as e:
+            print(f"Extraction cache write failed: {e}")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Process-wide cache shared by every session and rerun.
+
+    Configured with ``EXTRACTION_CACHE_MAX_MB`` and ``EXTRACTION_CACHE_DIR``
+    (set the latter to an empty string to disable the disk tier).
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            max_mb = int(env.get("EXTRACTION_CACHE_MAX_MB", DEFAULT_MAX_BYTES // (1024 * 1024)))
+            disk_dir = env.get("EXTRACTION_CACHE_DIR", str(DEFAULT_DISK_DIR))
+            _cache = ExtractionCache(max_bytes=max_mb * 1024 * 1024, disk_dir=disk_dir or None)
+        return _cache
@@ -0,0 +1,31 @@
+import io
+from os import environ as env
+
+import pandas as pd
+from pptx import Presentation
+
+from chatbot.pdf_engine import iter_pages
+
+CSV_ROWS_PER_CHUNK = int(env.get("CSV_ROWS_PER_CHUNK", 200))
+
+
+# ===== Raw Extractors (bytes in, (locator, text) pairs out) =====
+def iter_pdf(data: bytes):
+    for number, text in iter_pages(data):
+        yield f"page {number}", text
+
+
+def iter_ppt(data: bytes):
+    prs = Presentation(io.BytesIO(data))
+    for number, slide in enumerate(prs.slides, start=1):
+        texts = [shape.text for shape in slide.shapes if hasattr(shape, "text")]
+        yield f"slide {number}", "\n".join(texts)
+
+
+def iter_csv(data: bytes, rows_per_chunk: int = CSV_ROWS_PER_CHUNK):
+    # Every chunk carries the header row so it can be read on its own.
+    first_row = 1
+    for frame in pd.read_csv(io.BytesIO(data), chunksize=rows_per_chunk):
+        last_row = first_row + len(frame) - 1
+        yield f"rows {first_row}-{last_row}", frame.to_csv(index=False)
+        first_row = last_row + 1
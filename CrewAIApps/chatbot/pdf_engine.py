@@ -0,0 +1,69 @@
+import atexit
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from os import environ as env
+
+from PyPDF2 import PdfReader
+
+# Below this many pages the serial path wins: pool startup and each worker
+# re-reading the document's structure cost more than the extraction itself.
+PARALLEL_MIN_PAGES = int(env.get("PDF_PARALLEL_MIN_PAGES", 40))
+PAGES_PER_SHARD = int(env.get("PDF_PAGES_PER_SHARD", 16))
+MAX_WORKERS = int(env.get("PDF_MAX_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawn, not fork: forking the threaded Streamlit server can copy a held lock into the child.
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(_pool.shutdown, wait=False)
+        return _pool
+
+
+def _extract_range(path: str, start: int, stop: int):
+    # PdfReader parses pages lazily, so a worker only reads the objects of its own pages.
+    with open(path, "rb") as f:
+        reader = PdfReader(f)
+        return [(number + 1, reader.pages[number].extract_text() or "") for number in range(start, stop)]
+
+
+def page_ranges(page_count: int, pages_per_shard: int = PAGES_PER_SHARD):
+    return [(start, min(start + pages_per_shard, page_count)) for start in range(0, page_count, pages_per_shard)]
+
+
+def iter_pages(data: bytes, min_pages: int = PARALLEL_MIN_PAGES, pages_per_shard: int = PAGES_PER_SHARD):
+    """Yield ``(page_number, text)`` in page order (1-based page numbers).
+
+    Documents with at least ``min_pages`` pages are split into shards of
+    ``pages_per_shard`` pages and extracted across a shared process pool;
+    each shard is yielded as soon as it and every shard before it are done.
+    The document is written to a temp file once and workers get its path,
+    not a pickled copy of the bytes each.
+    """
+    reader = PdfReader(io.BytesIO(data))
+    page_count = len(reader.pages)
+    if page_count < min_pages or MAX_WORKERS < 2:
+        for number, page in enumerate(reader.pages, start=1):
+            yield number, page.extract_text() or ""
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(data)
+    pool = _get_pool()
+    futures = [pool.submit(_extract_range, f.name, start, stop) for start, stop in page_ranges(page_count, pages_per_shard)]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        os.unlink(f.name)
@@ -0,0 +1,43 @@
+from typing import NamedTuple
+
+from chatbot.extractors import iter_csv, iter_pdf, iter_ppt
+
+MIME_KINDS = {
+    "application/pdf": "pdf",
+    "application/vnd.ms-powerpoint": "ppt",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": "ppt",
+    "text/csv": "csv",
+}
+
+EXTRACTORS = {
+    "pdf": iter_pdf,
+    "ppt": iter_ppt,
+    "csv": iter_csv,
+}
+
+
+class Chunk(NamedTuple):
+    file: str
+    kind: str  # "pdf", "ppt" or "csv"
+    locator: str  # "page 3", "slide 2", "rows 1-200"
+    text: str
+
+
+def kind_for_mime(mime_type: str):
+    return MIME_KINDS.get(mime_type)
+
+
+def iter_file_chunks(name: str, kind: str, data: bytes, cache=None):
+    """Yield the chunks of one file as they are extracted.
+
+    With a cache, a previously seen file is replayed from it and a new one is
+    recorded while it streams, so each file's bytes are parsed at most once.
+    """
+    extractor = EXTRACTORS[kind]
+    if cache is None:
+        pieces = extractor(data)
+    else:
+        pieces = cache.iter_through(f"{kind}:chunks", data, extractor)
+    for locator, text in pieces:
+        yield Chunk(name, kind, locator, text)
+
@@ -0,0 +1,114 @@
+import threading
+import time
+from os import environ as env
+
+from services.stats import percentile
+
+STREAM_MODEL = env.get("DOC_STREAM_MODEL", "gpt-4o")
+STREAM_MAX_TOKENS = int(env.get("DOC_STREAM_MAX_TOKENS", 800))
+
+SYSTEM_PROMPT = (
+    "You are a document and data analyst. Answer the user's question using only the "
+    "document excerpts and CSV rows provided. Say so if they do not contain the answer."
+)
+
+ANSWER_PROMPT = """Question: {question}
+
+Relevant document excerpts:
+{document_context}
+
+Relevant CSV rows:
+{csv_context}"""
+
+
+class StreamMetrics:
+    """Timing of one streamed answer."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_token_seconds = None
+        self.total_seconds = None
+        self.tokens = 0
+
+    def token(self):
+        if self.first_token_seconds is None:
+            self.first_token_seconds = time.perf_counter() - self.started
+        self.tokens += 1
+
+    def finish(self, completion_tokens=None):
+        self.total_seconds = time.perf_counter() - self.started
+        if completion_tokens:
+            self.tokens = completion_tokens
+
+    @property
+    def tokens_per_second(self) -> float:
+        if self.first_token_seconds is None or not self.total_seconds:
+            return 0.0
+        generating = self.total_seconds - self.first_token_seconds
+        return self.tokens / generating if generating > 0 else 0.0
+
+
+class StreamingStats:
+    """Time-to-first-token and generation speed across streamed answers."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._samples = []  # (first_token_seconds, total_seconds, tokens_per_second)
+        self._lock = threading.Lock()
+
+    def record(self, metrics: StreamMetrics):
+        with self._lock:
+            self._samples.append((metrics.first_token_seconds or metrics.total_seconds, metrics.total_seconds,
+                                  metrics.tokens_per_second))
+            del self._samples[:-self.max_samples]
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = list(self._samples)
+        first_tokens = [sample[0] for sample in samples]
+
+        return {
+            "answers": len(samples),
+            "ttft_p50_seconds": round(percentile(first_tokens, 0.5), 3),
+            "ttft_p95_seconds": round(percentile(first_tokens, 0.95), 3),
+            "avg_total_seconds": round(sum(sample[1] for sample in samples) / len(samples), 3) if samples else 0.0,
+            "avg_tokens_per_second": round(sum(sample[2] for sample in samples) / len(samples), 1) if samples else 0.0,
+        }
+
+
+streaming_stats = StreamingStats()
+
+
+def stream_answer(client, question, document_context, csv_context, metrics: StreamMetrics,
+                  model: str = STREAM_MODEL, max_tokens: int = STREAM_MAX_TOKENS):
+    """Yield the answer's text deltas as they arrive, filling in ``metrics``.
+
+    Suitable for ``st.write_stream``. The final usage chunk, when the API
+    sends one, gives the exact completion token count.
+    """
+    stream = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": ANSWER_PROMPT.format(
+                question=question, document_context=document_context, csv_context=csv_context,
+            )},
+        ],
+        max_tokens=max_tokens,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    completion_tokens = None
+    try:
+        for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                completion_tokens = chunk.usage.completion_tokens
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                metrics.token()
+                yield delta
+    finally:
+        metrics.finish(completion_tokens)
+        streaming_stats.record(metrics)
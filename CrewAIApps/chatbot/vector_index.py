@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from os import environ as env
+from pathlib import Path
+
+import numpy as np
+
+CHUNK_SIZE = int(env.get("DOC_CHUNK_SIZE", 1000))
+CHUNK_OVERLAP = int(env.get("DOC_CHUNK_OVERLAP", 150))
+APPROX_MIN_ROWS = int(env.get("DOC_APPROX_MIN_ROWS", 5000))
+LSH_TABLES = int(env.get("DOC_LSH_TABLES", 8))
+LSH_BITS = int(env.get("DOC_LSH_BITS", 10))
+# Approximate candidates to score per requested result; fewer falls back to exact search.
+MIN_CANDIDATES_PER_K = int(env.get("DOC_MIN_CANDIDATES_PER_K", 50))
+EMBED_BATCH_SIZE = int(env.get("DOC_EMBED_BATCH_SIZE", 64))
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent / ".cache" / "vector_index"
+
+
+# ===== Chunking =====
+def split_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP):
+    """Split text into windows of at most ``chunk_size`` chars overlapping by ``overlap``.
+
+    Windows end on whitespace where possible so words are not cut in half.
+    """
+    text = text.strip()
+    if len(text) <= chunk_size:
+        return [text] if text else []
+
+    pieces = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            boundary = text.rfind(" ", start + overlap + 1, end)
+            if boundary != -1:
+                end = boundary
+        pieces.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return [piece for piece in pieces if piece]
+
+
+# ===== Embedders =====
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder; needs no network, useful offline."""
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in re.findall(r"\w+", text.lower()):
+                digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                matrix[row, value % self.dim] += 1.0 if value & (1 << 63) else -1.0
+        return matrix
+
+
+class OpenAIEmbedder:
+    def __init__(self, client, model: str = "text-embedding-3-small", batch_size: int = EMBED_BATCH_SIZE):
+        self.client = client
+        self.model = model
+        self.batch_size = batch_size
+        self.name = f"openai-{model}"
+
+    def embed(self, texts):
+        rows = []
+        for start in range(0, len(texts), self.batch_size):
+            response = self.client.embeddings.create(model=self.model, input=texts[start:start + self.batch_size])
+            rows.extend(item.embedding for item in response.data)
+        return np.asarray(rows, dtype=np.float32)
+
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+# ===== Index =====
+class LSHIndex:
+    """Random-hyperplane LSH over several tables.
+
+    Candidates are the union of the query's bucket and its 1-bit neighbours
+    in every table; independent tables keep recall up where one would miss
+    near neighbours that fall just across a hyperplane.
+    """
+
+    def __init__(self, matrix, bits: int = LSH_BITS, tables: int = LSH_TABLES, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((tables, matrix.shape[1], bits)).astype(np.float32)
+        self.bits = bits
+        self.tables = []
+        for signatures in self._signatures(matrix):
+            buckets = {}
+            for row, signature in enumerate(signatures):
+                buckets.setdefault(int(signature), []).append(row)
+            self.tables.append(buckets)
+
+    def _signatures(self, matrix):
+        # (tables, rows) bucket ids
+        projected = np.einsum("rd,tdb->trb", matrix, self.planes) > 0
+        return projected.astype(np.int64) @ (1 << np.arange(self.bits, dtype=np.int64))
+
+    def candidates(self, vector):
+        rows = []
+        for buckets, signature in zip(self.tables, self._signatures(vector[None, :])[:, 0]):
+            signature = int(signature)
+            rows.extend(buckets.get(signature, []))
+            for bit in range(self.bits):
+                rows.extend(buckets.get(signature ^ (1 << bit), []))
+        return np.unique(np.asarray(rows, dtype=np.int64))
+
+
+class DocumentIndex:
+    """Embedding matrix plus passage metadata for one document."""
+
+    def __init__(self, passages, matrix):
+        self.passages = passages  # [{"file", "kind", "locator", "text"}]
+        self.matrix = _normalize(np.asarray(matrix, dtype=np.float32)) if len(passages) else np.zeros((0, 0), np.float32)
+        self._approx = None
+        if len(passages) >= APPROX_MIN_ROWS:
+            self._approx = LSHIndex(self.matrix)
+
+    @classmethod
+    def build(cls, chunks, embedder, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP):
+        """Embed a stream of extraction chunks batch by batch as they arrive."""
+        passages, blocks, pending = [], [], []
+
+        def flush():
+            if pending:
+                blocks.append(embedder.embed([passage["text"] for passage in pending]))
+                passages.extend(pending)
+                pending.clear()
+
+        for chunk in chunks:
+            for text in split_text(chunk.text, chunk_size, overlap):
+                pending.append({"file": chunk.file, "kind": chunk.kind, "locator": chunk.locator, "text": text})
+                if len(pending) >= EMBED_BATCH_SIZE:
+                    flush()
+        flush()
+        matrix = np.vstack(blocks) if blocks else np.zeros((0, 0), np.float32)
+        return cls(passages, matrix)
+
+    def search(self, query_vector, k: int = 5, kinds=None):
+        """Return ``[(score, passage), ...]`` by descending cosine similarity."""
+        if not self.passages:
+            return []
+        query = _normalize(np.asarray(query_vector, dtype=np.float32)[None, :])[0]
+
+        rows = None
+        if self._approx is not None:
+            rows = self._filter_kinds(self._approx.candidates(query), kinds)
+            # Too few candidates to trust the ranking; exact search is still cheap at this size.
+            if len(rows) < MIN_CANDIDATES_PER_K * k:
+                rows = None
+        if rows is None:
+            rows = self._filter_kinds(np.arange(len(self.passages)), kinds)
+        if len(rows) == 0:
+            return []
+
+        scores = self.matrix[rows] @ query
+        top = np.argsort(-scores)[:k]
+        return [(float(scores[i]), self.passages[rows[i]]) for i in top]
+
+    def _filter_kinds(self, rows, kinds):
+        if not kinds:
+            return rows
+        return rows[[self.passages[row]["kind"] in kinds for row in rows]]
+
+    def save(self, path: Path):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.mkdir(parents=True, exist_ok=True)
+        np.save(tmp_path / "matrix.npy", self.matrix)
+        with open(tmp_path / "passages.json", "w") as f:
+            json.dump(self.passages, f)
+        if path.exists():
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path):
+        with open(path / "passages.json") as f:
+            passages = json.load(f)
+        return cls(passages, np.load(path / "matrix.npy"))
+
+
+class IndexStore:
+    """Per-document indexes keyed by content hash, cached in memory and on disk."""
+
+    def __init__(self, root=DEFAULT_INDEX_DIR, max_loaded: int = 32,
+                 chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP):
+        self.root = Path(root) if root else None
+        self.max_loaded = max_loaded
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self._loaded = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, doc_hash, embedder):
+        return f"{doc_hash}-{embedder.name}-{self.chunk_size}-{self.overlap}"
+
+    def get(self, doc_hash: str, embedder):
+        """Return a loaded or persisted index, or ``None`` if it was never built."""
+        key = self._key(doc_hash, embedder)
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key]
+
+        path = self.root / key if self.root else None
+        if path is None or not path.exists():
+            return None
+        index = DocumentIndex.load(path)
+        self._remember(key, index)
+        return index
+
+    def get_or_build(self, doc_hash: str, chunks, embedder) -> DocumentIndex:
+        index = self.get(doc_hash, embedder)
+        if index is None:
+            index = DocumentIndex.build(chunks, embedder, self.chunk_size, self.overlap)
+            if self.root:
+                index.save(self.root / self._key(doc_hash, embedder))
+            self._remember(self._key(doc_hash, embedder), index)
+        return index
+
+    def _remember(self, key, index):
+        with self._lock:
+            self._loaded[key] = index
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+
+    def search(self, doc_hashes, query_vector, embedder, k: int = 5, kinds=None):
+        """Top-k passages across several already-built document indexes.
+
+        ``query_vector`` is the query embedded once with ``embedder`` by the
+        caller, so several searches for one question share it.
+        """
+        results = []
+        for doc_hash in doc_hashes:
+            index = self.get(doc_hash, embedder)
+            if index is not None:
+                results.extend(index.search(query_vector, k, kinds))
+        results.sort(key=lambda item: -item[0])
+        return results[:k]
+
+
+def format_passages(results) -> str:
+    return "\n\n".join(f"[{passage['file']}, {passage['locator']}]\n{passage['text']}" for _, passage in results)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_index_store() -> IndexStore:
+    """Process-wide index store; ``DOC_INDEX_DIR=""`` keeps indexes in memory only."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = IndexStore(root=env.get("DOC_INDEX_DIR", str(DEFAULT_INDEX_DIR)) or None)
+        return _store
+
+
+def get_embedder(client=None):
+    if env.get("DOC_EMBEDDER", "openai") == "hashing" or client is None:
+        return HashingEmbedder()
+    return OpenAIEmbedder(client, model=env.get("DOC_EMBEDDING_MODEL", "text-embedding-3-small"))
@@ -1,15 +1,71 @@
+import threading
 from os import environ as env
 from dotenv import load_dotenv
 load_dotenv()
 
-import openai
-from langchain.llms import OpenAI
-
 api_key = env["OPENAI_API_KEY"]
-openai.api_key = api_key
 
-# Step 2: Initialize the LLM gpt-3.5-turbo, gpt-4o, gpt-4.1-mini, gpt-4, gpt-4o
-llm = OpenAI(model="gpt-4", temperature=0.7, openai_api_key=api_key) # gpt-4o-mini, # gpt-3.5-turbo
+LAZY_ATTRIBUTES = ("llm", "base_llm", "llm_cache", "model_router")
+_lazy = {}
+_lazy_lock = threading.Lock()
+_models = {}
+_routed = {}
+
+
+def _openai_llm(model):
+    """One CrewAI LLM per model name; ``RoutedLLM`` picks which one answers each call."""
+    with _lazy_lock:
+        if model not in _models:
+            from crewai import LLM
+
+            _models[model] = LLM(model=model, temperature=0.7, api_key=api_key)
+        return _models[model]
+
+
+def _build_llm():
+    import openai
+    from services.llm_cache import get_llm_cache
+    from services.model_router import get_model_router
+    from services.routed_llm import RoutedLLM
+
+    openai.api_key = api_key
+
+    # Step 2: Initialize the LLM gpt-3.5-turbo, gpt-4o, gpt-4.1-mini, gpt-4, gpt-4o
+    # Models per agent/task come from config/models.yaml; "default" is gpt-4 unless configured otherwise.
+    model_router = get_model_router()
+    base_llm = RoutedLLM(route="default", router=model_router, factory=_openai_llm)
+
+    # Repeated (and, with LLM_SEMANTIC_CACHE=1, near-identical) prompts are answered from disk,
+    # keyed on the model that actually answered them.
+    llm_cache = get_llm_cache()
+    return {"base_llm": base_llm, "llm_cache": llm_cache, "model_router": model_router,
+            "llm": RoutedLLM(route="default", router=model_router, factory=_openai_llm, cache=llm_cache)}
+
+
+def _lazy_attribute(name):
+    with _lazy_lock:
+        if not _lazy:
+            _lazy.update(_build_llm())
+    return _lazy[name]
+
+
+def llm_for(route):
+    """The cached LLM for a route in config/models.yaml, e.g. ``llm_for("recruitment.reporter")``."""
+    from services.routed_llm import RoutedLLM
+
+    model_router = _lazy_attribute("model_router")
+    llm_cache = _lazy_attribute("llm_cache")
+    with _lazy_lock:
+        if route not in _routed:
+            _routed[route] = RoutedLLM(route=route, router=model_router, factory=_openai_llm, cache=llm_cache)
+        return _routed[route]
+
+
+def __getattr__(name):
+    # `from config import llm` builds the LLM (and imports crewai) on first use, not at import.
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy_attribute(name)
 
 # openai_embeddings = OpenAIEmbeddings(
 #     model="text-embedding-ada-002",
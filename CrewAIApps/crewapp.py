@@ -1,7 +1,14 @@
+import importlib
+import sys
+
 import streamlit as st
-from tab1_chatbot import render_tab1
-from tab2_financial_analysis import render_tab2
-from tab3_recruitment import render_tab3
+
+# Tab label -> (module, render function); only the selected tab's module is imported.
+TABS = {
+    "📄 Chatbot with Docs": ("tab1_chatbot", "render_tab1"),
+    "📊 Financial Analysis": ("tab2_financial_analysis", "render_tab2"),
+    "🤖 Job Recruitment": ("tab3_recruitment", "render_tab3"),
+}
 
 st.set_page_config(
     page_title="Agentic AI Chatbot",
@@ -13,9 +20,28 @@ st.set_page_config(
 st.sidebar.title("🧭 Navigation")
 selected_tab = st.sidebar.radio(
     "Choose a feature",
-    ["📄 Chatbot with Docs", "📊 Financial Analysis", "🤖 Job Recruitment"]
+    list(TABS)
 )
 
+# Per-route model latency, for tuning config/models.yaml.
+# Rendered before the tab, which may st.stop() or st.rerun() part way. An
+# expander's body runs even while collapsed, so a toggle gates it instead,
+# and it never imports the router itself: until a tab has loaded it there
+# are no stats to show.
+if st.sidebar.toggle("⏱️ Model routes"):
+    router_module = sys.modules.get("services.model_router")
+    route_stats = router_module.get_model_router().stats() if router_module else {}
+    if not route_stats:
+        st.sidebar.caption("No model calls yet.")
+    for route_name, route in route_stats.items():
+        state = " (degraded)" if route["degraded"] else ""
+        st.sidebar.markdown(f"**{route_name}**{state}: {route['requests']} requests, {route['fallbacks']} on fallback")
+        for model, histogram in route["models"].items():
+            st.sidebar.caption(
+                f"{model}: {histogram['count']} calls, p50 {histogram['p50_seconds']:.2f}s, "
+                f"p95 {histogram['p95_seconds']:.2f}s, {histogram['errors']} errors"
+            )
+
 # Main Title & Intro
 st.title("🤖 Crew Agentic AI Chatbot")
 st.markdown("""
@@ -25,14 +51,5 @@ Explore different functionalities powered by autonomous agents.
 st.divider()
 
 # Render only the selected tab
-if selected_tab == "📄 Chatbot with Docs":
-    # st.subheader("📄 Document Chatbot")
-    render_tab1()
-
-elif selected_tab == "📊 Financial Analysis":
-    # st.subheader("📊 AI Financial Analysis")
-    render_tab2()
-
-elif selected_tab == "🤖 Job Recruitment":
-    # st.subheader("🤖 Recruitment Assistant")
-    render_tab3()
+module_name, render_name = TABS[selected_tab]
+getattr(importlib.import_module(module_name), render_name)()
@@ -0,0 +1,135 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from os import environ as env
+
+MAX_WORKERS = int(env.get("FINANCIAL_CREW_WORKERS", 4))
+FOLLOWUP_WORKERS = int(env.get("FINANCIAL_FOLLOWUP_WORKERS", 2))
+MAX_JOBS = int(env.get("FINANCIAL_MAX_JOBS", 200))
+
+
+class CrewJob:
+    """Handle for one crew kickoff running in the background.
+
+    ``task_outputs`` grows as each task finishes, so a page polling the job
+    can render every section as soon as it is available.
+    """
+
+    def __init__(self, inputs):
+        self.id = uuid.uuid4().hex
+        self.inputs = dict(inputs)
+        self.status = "queued"
+        self.task_outputs = []  # [(task label, raw output)]
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @staticmethod
+    def task_label(output) -> str:
+        # Under the hierarchical process every output's agent is the manager,
+        # so sections are labelled by task: its name, else its description.
+        label = getattr(output, "name", None) or getattr(output, "description", None)
+        if label:
+            label = str(label).strip().splitlines()[0]
+            return label if len(label) <= 80 else label[:79] + "…"
+        return str(getattr(output, "agent", None) or "Task").strip()
+
+    def record_task(self, output):
+        text = getattr(output, "raw", None) or str(output)
+        with self._lock:
+            self.task_outputs.append((self.task_label(output), text))
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.task_outputs)
+
+    def wait(self, timeout=None) -> bool:
+        return self._done.wait(timeout)
+
+    def mark_cancelled(self):
+        self.status = "cancelled"
+        self.finished_at = time.time()
+        self._done.set()
+
+    def run(self, crew):
+        self.status = "running"
+        self.started_at = time.time()
+        try:
+            crew.task_callback = self.record_task
+            self.result = crew.kickoff(inputs=self.inputs)
+            self.status = "done"
+        except Exception as e:
+            self.error = e
+            self.status = "failed"
+        finally:
+            self.finished_at = time.time()
+            self._done.set()
+
+
+class JobManager:
+    """Runs crew kickoffs on bounded worker pools, off the Streamlit script thread.
+
+    Follow-up questions get their own pool, so they are answered while full
+    analyses queue up behind each other.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, followup_workers: int = FOLLOWUP_WORKERS,
+                 max_jobs: int = MAX_JOBS):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crew-job")
+        self._followup_executor = ThreadPoolExecutor(max_workers=followup_workers, thread_name_prefix="crew-followup")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _submit(self, executor, crew, inputs) -> CrewJob:
+        job = CrewJob(inputs)
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                oldest_id = next(iter(self._jobs))
+                if not self._jobs[oldest_id].done:
+                    break
+                del self._jobs[oldest_id]
+        job.future = executor.submit(job.run, crew)
+        return job
+
+    def submit(self, crew, inputs) -> CrewJob:
+        return self._submit(self._executor, crew, inputs)
+
+    def submit_followup(self, crew, inputs) -> CrewJob:
+        return self._submit(self._followup_executor, crew, inputs)
+
+    def cancel(self, job_id) -> bool:
+        """Cancel a job that has not started yet; a running kickoff cannot be interrupted."""
+        job = self.get(job_id)
+        if job is None or job.future is None or not job.future.cancel():
+            return False
+        job.mark_cancelled()
+        return True
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
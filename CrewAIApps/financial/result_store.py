@@ -0,0 +1,79 @@
+import threading
+import time
+from collections import OrderedDict
+from os import environ as env
+
+FRESHNESS_SECONDS = float(env.get("FINANCIAL_RESULT_TTL_SECONDS", 15 * 60))
+MAX_PROFILES = int(env.get("FINANCIAL_MAX_PROFILES", 256))
+
+PROFILE_FIELDS = (
+    "stock_selection",
+    "initial_capital",
+    "risk_tolerance",
+    "trading_strategy_preference",
+    "news_impact_consideration",
+)
+
+
+def profile_key(inputs) -> tuple:
+    values = []
+    for field in PROFILE_FIELDS:
+        value = inputs.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+            if field == "stock_selection":
+                value = value.upper()
+        values.append(value)
+    return tuple(values)
+
+
+class ResultStore:
+    """Base analysis jobs keyed on the trading profile.
+
+    A profile is analysed once per freshness window: later requests get the
+    finished job back, and requests made while it runs share the same job.
+    """
+
+    def __init__(self, freshness: float = FRESHNESS_SECONDS, max_profiles: int = MAX_PROFILES):
+        self.freshness = freshness
+        self.max_profiles = max_profiles
+        self._jobs = OrderedDict()  # profile key -> CrewJob
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def is_fresh(self, job) -> bool:
+        return job.status == "done" and time.time() - job.finished_at <= self.freshness
+
+    def get_or_submit(self, inputs, submit):
+        """Return the running or fresh job for this profile, else ``submit()`` a new one."""
+        key = profile_key(inputs)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and (not job.done or self.is_fresh(job)):
+                self._jobs.move_to_end(key)
+                self.hits += 1
+                return job
+
+            job = submit()
+            self._jobs[key] = job
+            self.misses += 1
+            while len(self._jobs) > self.max_profiles:
+                self._jobs.popitem(last=False)
+            return job
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"profiles": len(self._jobs), "hits": self.hits, "misses": self.misses}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore()
+        return _store
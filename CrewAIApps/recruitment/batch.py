@@ -0,0 +1,184 @@
+"""Run many job requisitions through the recruitment crew in one go.
+
+From CrewAIApps/:
+    python -m recruitment.batch requisitions.yaml --workers 3
+
+Requisitions come from YAML (a list, or ``requisitions:`` holding one) or
+CSV with one column per job section. Each report is written as soon as its
+requisition finishes, next to a ``summary.jsonl`` of per-stage timings.
+"""
+import argparse
+import csv
+import io
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import environ as env
+from pathlib import Path
+
+import yaml
+
+from recruitment.requisition import JobRequisition
+from recruitment.result_cache import get_result_cache
+from recruitment.runner import kickoff_recruitment
+from services.stats import percentile
+
+BATCH_WORKERS = int(env.get("RECRUITMENT_BATCH_WORKERS", 3))
+REPORTS_DIR = Path(env.get("RECRUITMENT_REPORTS_DIR", Path(__file__).parent.parent / ".cache" / "recruitment_reports"))
+
+
+# ===== Loading =====
+def load_requisitions(data, name: str) -> list:
+    """Parse requisitions from YAML or CSV text/bytes; ``name`` picks the format by extension."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8-sig")
+    if name.lower().endswith(".csv"):
+        rows = list(csv.DictReader(io.StringIO(data)))
+    else:
+        rows = yaml.safe_load(data) or []
+        if isinstance(rows, dict):
+            rows = rows.get("requisitions", [rows])
+    requisitions = [JobRequisition.from_dict(row, id=str(index)) for index, row in enumerate(rows, start=1)]
+    return [requisition for requisition in requisitions if requisition.title]
+
+
+def load_requisition_file(path) -> list:
+    path = Path(path)
+    return load_requisitions(path.read_bytes(), path.name)
+
+
+def report_filename(requisition: JobRequisition) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", requisition.title.lower()).strip("-")[:60]
+    return f"{requisition.id}-{slug or 'requisition'}.md"
+
+
+# ===== Metrics =====
+class BatchStats:
+    """Throughput and per-stage latency for one batch run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.completed = 0
+        self.failed = 0
+        self._stages = {}  # stage -> [seconds]
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._stages.setdefault(stage, []).append(seconds)
+
+    def finish(self, ok: bool):
+        with self._lock:
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            stages = {stage: list(samples) for stage, samples in self._stages.items()}
+            completed, failed = self.completed, self.failed
+        elapsed = time.perf_counter() - self.started
+
+        return {
+            "completed": completed,
+            "failed": failed,
+            "wall_seconds": round(elapsed, 2),
+            "requisitions_per_hour": round(completed / elapsed * 3600, 1) if elapsed else 0.0,
+            "stages": {
+                stage: {
+                    "count": len(samples),
+                    "mean_s": round(sum(samples) / len(samples), 2),
+                    "p50_s": round(percentile(samples, 0.5), 2),
+                    "p95_s": round(percentile(samples, 0.95), 2),
+                }
+                for stage, samples in stages.items()
+            },
+        }
+
+
+# ===== Running =====
+class RecruitmentBatch:
+    """Runs requisitions on a bounded worker pool and writes each report as it finishes.
+
+    Every requisition's crew shares the process-wide candidate store, search
+    and scrape caches and browser pool, so roles with overlapping skills reuse
+    each other's candidate searches; duplicate requisitions run once.
+    """
+
+    def __init__(self, requisitions, out_dir, workers: int = BATCH_WORKERS):
+        self.requisitions = list(requisitions)
+        self.out_dir = Path(out_dir)
+        self.workers = max(1, workers)
+        self.stats = BatchStats()
+        self._summary_lock = threading.Lock()
+
+    def run(self):
+        """Yield one result dict per requisition, in completion order."""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = BatchStats()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="recruitment-batch") as executor:
+            futures = [executor.submit(self._run_one, requisition) for requisition in self.requisitions]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _run_one(self, requisition: JobRequisition) -> dict:
+        outcome = {"id": requisition.id, "title": requisition.title, "digest": requisition.digest, "stages": {}}
+        started = time.perf_counter()
+
+        def run():
+            return self._timed(outcome, "crew", kickoff_recruitment, requisition)
+
+        try:
+            (result, timeline), cached = get_result_cache().get_or_run(requisition.digest, run)
+            if not cached:
+                for row in timeline.rows():
+                    if row["duration_s"] is not None:
+                        self._record(outcome, f"task:{row['task']}", row["duration_s"])
+            path = self.out_dir / report_filename(requisition)
+            self._timed(outcome, "write", path.write_text, result, encoding="utf-8")
+            outcome.update(status="done", cached=cached, report=str(path), result=result)
+        except Exception as e:
+            outcome.update(status="failed", error=str(e))
+            print(f"Requisition {requisition.id} ({requisition.title}) failed: {e}")
+        self._record(outcome, "total", time.perf_counter() - started)
+        self.stats.finish(outcome["status"] == "done")
+        self._append_summary(outcome)
+        return outcome
+
+    def _timed(self, outcome, stage, fn, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._record(outcome, stage, time.perf_counter() - started)
+
+    def _record(self, outcome, stage, seconds):
+        outcome["stages"][stage] = round(seconds, 2)
+        self.stats.record(stage, seconds)
+
+    def _append_summary(self, outcome):
+        line = json.dumps({key: value for key, value in outcome.items() if key != "result"})
+        with self._summary_lock, open(self.out_dir / "summary.jsonl", "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a batch of job requisitions through the recruitment crew.")
+    parser.add_argument("requisitions", help="YAML or CSV file of requisitions")
+    parser.add_argument("--out", default=str(REPORTS_DIR / time.strftime("batch-%Y%m%d-%H%M%S")))
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    args = parser.parse_args()
+
+    batch = RecruitmentBatch(load_requisition_file(args.requisitions), args.out, args.workers)
+    print(f"Running {len(batch.requisitions)} requisitions with {batch.workers} workers -> {batch.out_dir}")
+    for outcome in batch.run():
+        detail = outcome.get("report") or outcome.get("error")
+        print(f"[{outcome['status']}] {outcome['id']} {outcome['title']} ({outcome['stages']['total']}s): {detail}")
+    print(json.dumps(batch.stats.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
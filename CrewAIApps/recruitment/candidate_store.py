@@ -0,0 +1,231 @@
+import sqlite3
+import threading
+import time
+from os import environ as env
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / ".cache" / "candidates.sqlite3"
+STALE_AFTER_SECONDS = float(env.get("CANDIDATE_STALE_AFTER_SECONDS", 7 * 24 * 3600))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    profile_link TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    position TEXT,
+    location TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    profile_link TEXT NOT NULL REFERENCES candidates(profile_link) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (profile_link, skill)
+);
+CREATE TABLE IF NOT EXISTS searches (
+    query TEXT PRIMARY KEY,
+    searched_at REAL NOT NULL,
+    results INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_results (
+    query TEXT NOT NULL REFERENCES searches(query) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    profile_link TEXT NOT NULL REFERENCES candidates(profile_link) ON DELETE CASCADE,
+    PRIMARY KEY (query, rank)
+);
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_skill ON candidate_skills(skill);
+CREATE INDEX IF NOT EXISTS idx_candidates_location ON candidates(location COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates(position COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_candidates_last_seen ON candidates(last_seen);
+"""
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(skill.lower().split())
+
+
+def split_skills(skills) -> list:
+    if isinstance(skills, str):
+        skills = skills.split(",")
+    return list(dict.fromkeys(normalize_skill(skill) for skill in skills if skill.strip()))
+
+
+def query_key(skills) -> str:
+    # Order-insensitive, so "ruby,react" and "React, Ruby" are the same search.
+    return ",".join(sorted(split_skills(skills)))
+
+
+class CandidateStore:
+    """Embedded store of candidates found by past searches, keyed by profile link.
+
+    Each candidate is tagged with the skills whose searches found them, and
+    every completed search is logged with the candidates it returned, so
+    callers can replay covered queries exactly and only scrape for the gaps.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, stale_after: float = STALE_AFTER_SECONDS):
+        self.path = str(path)
+        self.stale_after = stale_after
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+            # Searches logged with results before those results were kept cannot be replayed;
+            # searches that found nobody have nothing to replay and stay valid.
+            self._conn.execute(
+                "DELETE FROM searches WHERE results > 0 AND query NOT IN (SELECT query FROM search_results)"
+            )
+
+    def upsert(self, people, skills):
+        now = time.time()
+        skills = split_skills(skills)
+        with self._lock, self._conn:
+            for person in people:
+                link = person.get("profile_link")
+                if not link:
+                    continue
+                self._conn.execute(
+                    """
+                    INSERT INTO candidates (profile_link, name, position, location, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(profile_link) DO UPDATE SET
+                        name = excluded.name,
+                        position = excluded.position,
+                        location = excluded.location,
+                        last_seen = excluded.last_seen
+                    """,
+                    (link, person.get("name", ""), person.get("position"), person.get("location"), now, now),
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO candidate_skills (profile_link, skill) VALUES (?, ?)",
+                    [(link, skill) for skill in skills],
+                )
+
+    def record_search(self, query: str, people):
+        """Log a completed search and the candidates it returned, in order.
+
+        Only call this when the results page actually loaded; a logged
+        search is replayed instead of scraped until it goes stale.
+        """
+        key = query_key(query)
+        links = list(dict.fromkeys(person["profile_link"] for person in people if person.get("profile_link")))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM search_results WHERE query = ?", (key,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches (query, searched_at, results) VALUES (?, ?, ?)",
+                (key, time.time(), len(links)),
+            )
+            self._conn.executemany(
+                "INSERT INTO search_results (query, rank, profile_link) VALUES (?, ?, ?)",
+                [(key, rank, link) for rank, link in enumerate(links)],
+            )
+
+    def search_results(self, query: str, max_age: float = None):
+        """The candidates a fresh logged search returned, in their original order; None if not fresh."""
+        if not self.is_fresh_search(query, max_age):
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT c.profile_link, c.name, c.position, c.location, c.last_seen
+                FROM search_results r
+                JOIN candidates c ON c.profile_link = r.profile_link
+                WHERE r.query = ?
+                ORDER BY r.rank
+                """,
+                (query_key(query),),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def is_fresh_search(self, query: str, max_age: float = None) -> bool:
+        max_age = self.stale_after if max_age is None else max_age
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT searched_at FROM searches WHERE query = ?", (query_key(query),)
+            ).fetchone()
+        return row is not None and time.time() - row["searched_at"] <= max_age
+
+    def find(self, skills, location: str = None, position: str = None, max_age: float = None, limit: int = 50):
+        """Fresh candidates matching any of ``skills``, most matched skills first."""
+        skills = split_skills(skills)
+        if not skills:
+            return []
+        max_age = self.stale_after if max_age is None else max_age
+        query = f"""
+            SELECT c.profile_link, c.name, c.position, c.location, c.last_seen,
+                   COUNT(s.skill) AS matched_skills, GROUP_CONCAT(s.skill, ',') AS skills
+            FROM candidate_skills s
+            JOIN candidates c ON c.profile_link = s.profile_link
+            WHERE s.skill IN ({",".join("?" * len(skills))}) AND c.last_seen >= ?
+        """
+        params = [*skills, time.time() - max_age]
+        if location:
+            query += " AND c.location LIKE ? COLLATE NOCASE"
+            params.append(f"%{location}%")
+        if position:
+            query += " AND c.position LIKE ? COLLATE NOCASE"
+            params.append(f"%{position}%")
+        query += " GROUP BY c.profile_link ORDER BY matched_skills DESC, c.last_seen DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def by_links(self, links):
+        """Known candidates among ``links``, with their skill tags, in the order given."""
+        links = list(dict.fromkeys(link.split("?", 1)[0].rstrip("/") for link in links if link))
+        if not links:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT c.profile_link, c.name, c.position, c.location, c.last_seen,
+                       GROUP_CONCAT(s.skill, ', ') AS skills
+                FROM candidates c
+                LEFT JOIN candidate_skills s ON s.profile_link = c.profile_link
+                WHERE c.profile_link IN ({",".join("?" * len(links))})
+                GROUP BY c.profile_link
+                """,
+                links,
+            ).fetchall()
+        found = {row["profile_link"]: dict(row) for row in rows}
+        return [found[link] for link in links if link in found]
+
+    def recent(self, max_age: float = None, limit: int = 5000):
+        """All fresh candidates with their skill tags, most recently seen first."""
+        max_age = self.stale_after if max_age is None else max_age
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT c.profile_link, c.name, c.position, c.location, c.last_seen,
+                       GROUP_CONCAT(s.skill, ', ') AS skills
+                FROM candidates c
+                LEFT JOIN candidate_skills s ON s.profile_link = c.profile_link
+                WHERE c.last_seen >= ?
+                GROUP BY c.profile_link
+                ORDER BY c.last_seen DESC
+                LIMIT ?
+                """,
+                (time.time() - max_age, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_candidate_store() -> CandidateStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CandidateStore(env.get("CANDIDATE_DB_PATH", str(DEFAULT_DB_PATH)))
+        return _store
@@ -0,0 +1,199 @@
+import re
+import threading
+import time
+from os import environ as env
+
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken missing or its encoding not downloadable
+    _encoding = None
+
+CONTEXT_TOKEN_BUDGET = int(env.get("REPORT_CONTEXT_TOKENS", 1500))
+TEMPLATE_PREVIEW_CHARS = 600
+
+PROFILE_LINK = re.compile(r"https?://(?:[\w-]+\.)?linkedin\.com/in/[\w%.-]+", re.IGNORECASE)
+SCORE = re.compile(r"\b(?:score|rating|match)\b[^0-9\n]{0,12}(\d{1,3}(?:\.\d+)?)(?:\s*(?:/|out of)\s*(\d{1,3}))?", re.IGNORECASE)
+TEMPLATE_ID = re.compile(r"\btemplate\s*#?\s*([A-Z0-9]{1,3})\b", re.IGNORECASE)
+POSITION = re.compile(r"^\W*(?:position|title|current role|role)\W*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+SKILLS = re.compile(r"^\W*(?:key |top |matching )?skills\W*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+# A block starts at a top-level numbered item, heading or bold bullet.
+BLOCK_START = re.compile(r"^(?:\d+[.)]\s+|#{1,6}\s+|[-*]\s+\*\*|\*\*)")
+NAME = re.compile(r"^[A-Z][\w'’.-]*(?:\s+[A-Z][\w'’.-]*){1,3}$")
+
+
+def count_tokens(text: str) -> int:
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def _blocks(text: str):
+    block = []
+    for line in text.splitlines():
+        if BLOCK_START.match(line) and block:
+            yield block
+            block = []
+        if line.strip():
+            block.append(line)
+    if block:
+        yield block
+
+
+def _heading(line: str) -> str:
+    line = re.sub(r"^(?:\d+[.)]|#{1,6}|[-*])\s*", "", line.strip())
+    return line.replace("*", "").replace("_", "").strip()
+
+
+def _candidate_name(heading: str):
+    name = re.split(r"\s+[-–—|(]\s*|:|,", heading, maxsplit=1)[0].strip()
+    if NAME.match(name) and not TEMPLATE_ID.search(name):
+        return name
+    return None
+
+
+def extract_candidates(texts) -> dict:
+    """Candidate key -> {name, link, position, score, skills, template}, merged over all upstream outputs.
+
+    Title-Case headings ("Ranked Candidates", "Outreach Methods") look like
+    names too, so only entries with a profile link, score or skills line
+    are kept.
+    """
+    candidates = {}
+    by_name = {}
+    for text in texts:
+        for block in _blocks(text):
+            name = _candidate_name(_heading(block[0]))
+            body = "\n".join(block)
+            link = PROFILE_LINK.search(body)
+            if not name:
+                continue
+            key = by_name.get(name.lower()) or (link.group(0).rstrip("/").lower() if link else name.lower())
+            by_name[name.lower()] = key
+            candidate = candidates.setdefault(key, {"name": name})
+            if link:
+                candidate.setdefault("link", link.group(0).rstrip("/"))
+            position = POSITION.search(body)
+            if position:
+                candidate.setdefault("position", position.group(1).replace("*", "").strip()[:80])
+            score = SCORE.search(body)
+            if score:
+                value = float(score.group(1))
+                if score.group(2) and float(score.group(2)) not in (0, 100):
+                    value = value / float(score.group(2)) * 100
+                candidate.setdefault("score", round(value))
+            skills = SKILLS.search(body)
+            if skills:
+                candidate.setdefault("skills", skills.group(1).replace("*", "").strip())
+            template = TEMPLATE_ID.search(body)
+            if template:
+                candidate.setdefault("template", template.group(1).upper())
+    return {key: candidate for key, candidate in candidates.items()
+            if "link" in candidate or "score" in candidate or "skills" in candidate}
+
+
+def extract_templates(texts) -> dict:
+    """Outreach template id -> ``(title, body)`` for blocks headed like "Template 2: Follow-up email"."""
+    templates = {}
+    for text in texts:
+        for block in _blocks(text):
+            heading = _heading(block[0])
+            match = TEMPLATE_ID.search(heading)
+            if not match or _candidate_name(heading):
+                continue
+            title = heading.split(":", 1)[1].strip() if ":" in heading else heading
+            body = " ".join(line.strip() for line in block[1:])
+            templates.setdefault(match.group(1).upper(), (title, body))
+    return templates
+
+
+def _truncate_to_tokens(text: str, budget: int) -> str:
+    if count_tokens(text) <= budget:
+        return text
+    if _encoding is not None:
+        return _encoding.decode(_encoding.encode(text, disallowed_special=())[:max(budget - 1, 0)]) + "…"
+    return text[:max(budget - 1, 0) * 4] + "…"
+
+
+def reduce_context(outputs, budget: int = CONTEXT_TOKEN_BUDGET) -> str:
+    """Compact the raw upstream outputs into at most ``budget`` tokens.
+
+    Candidates (best score first) and outreach templates are extracted into
+    one-line records; when nothing can be extracted each output is trimmed
+    to an equal share of the budget instead.
+    """
+    outputs = [output for output in outputs if output]
+    candidates = sorted(extract_candidates(outputs).values(), key=lambda c: -c.get("score", -1))
+    templates = extract_templates(outputs)
+    if not candidates:
+        share = budget // max(len(outputs), 1)
+        return "\n\n----------\n\n".join(_truncate_to_tokens(output, share) for output in outputs)
+
+    lines = ["Candidates (name | profile | position | score 0-100 | outreach template):"]
+    used = count_tokens(lines[0])
+    for candidate in candidates:
+        line = "- " + " | ".join(str(candidate.get(field, "-")) for field in ("name", "link", "position", "score", "template"))
+        cost = count_tokens(line) + 1
+        if used + cost > budget:
+            lines.append(f"- … {len(candidates) - len(lines) + 1} lower-scored candidates omitted")
+            return "\n".join(lines)
+        lines.append(line)
+        used += cost
+
+    if templates:
+        lines.append("Outreach templates:")
+        used += 4
+        for template_id, (title, body) in templates.items():
+            line = f"- Template {template_id} ({title}): {body[:TEMPLATE_PREVIEW_CHARS]}"
+            remaining = budget - used
+            if remaining < 16:
+                break
+            line = _truncate_to_tokens(line, remaining - 1)
+            lines.append(line)
+            used += count_tokens(line) + 1
+    return "\n".join(lines)
+
+
+class ContextReductionStats:
+    """Prompt tokens of the reporter's context before and after reduction."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._samples = []  # (tokens_before, tokens_after, seconds)
+        self._lock = threading.Lock()
+
+    def record(self, tokens_before, tokens_after, seconds):
+        with self._lock:
+            self._samples.append((tokens_before, tokens_after, seconds))
+            del self._samples[:-self.max_samples]
+
+    def last(self):
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = list(self._samples)
+        before = sum(sample[0] for sample in samples)
+        after = sum(sample[1] for sample in samples)
+        return {
+            "reductions": len(samples),
+            "tokens_before": before,
+            "tokens_after": after,
+            "saved_ratio": round(1 - after / before, 3) if before else 0.0,
+            "avg_reduce_ms": round(sum(sample[2] for sample in samples) / len(samples) * 1000, 2) if samples else 0.0,
+        }
+
+
+reduction_stats = ContextReductionStats()
+
+
+def reduce_task_context(context_tasks, budget: int = CONTEXT_TOKEN_BUDGET) -> str:
+    """Reduced context from the finished ``context_tasks``, recording before/after token counts."""
+    started = time.perf_counter()
+    outputs = [str(getattr(task.output, "raw", task.output) or "") for task in context_tasks if task.output]
+    reduced = reduce_context(outputs, budget)
+    original = sum(count_tokens(output) for output in outputs)
+    reduction_stats.record(original, count_tokens(reduced), time.perf_counter() - started)
+    return reduced
@@ -2,11 +2,15 @@ from pathlib import Path
 import yaml
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
 from recruitment.tools.linkedin import LinkedInTool
+from recruitment.tools.candidates import CandidateStoreTool
+from recruitment.scheduling import PARALLEL_TASKS, plan_parallel_tasks
+from recruitment.context_reduction import reduce_task_context
+from services.search_gateway import SearchTool
+from services.scrape_backend import ScrapeTool
 from openai import OpenAI
 from langchain.chat_models import ChatOpenAI
-from config import llm
+from config import llm_for
 from os import environ as env
 from dotenv import load_dotenv
 
@@ -21,6 +25,20 @@ def load_yaml(path):
     with open(path, "r") as f:
         return yaml.safe_load(f)
 
+class ReducedContextTask(Task):
+    """Task that sees a compact, token-budgeted digest of its upstream outputs."""
+
+    def execute_sync(self, agent=None, context=None, tools=None):
+        if context and isinstance(self.context, list):
+            context = reduce_task_context(self.context)
+        return super().execute_sync(agent=agent, context=context, tools=tools)
+
+    def copy(self, *args, **kwargs):
+        copied = super().copy(*args, **kwargs)
+        # Task.copy rebuilds a plain Task; keep the override on per-request crews.
+        copied.__class__ = type(self)
+        return copied
+
 @CrewBase
 class RecruitmentCrew:
     """Recruitment crew powered by CrewAI"""
@@ -33,7 +51,8 @@ class RecruitmentCrew:
     def researcher(self) -> Agent:
         return Agent(
             config=self.agents_config['researcher'],
-            tools=[SerperDevTool(), ScrapeWebsiteTool(), LinkedInTool()],
+            llm=llm_for("recruitment.researcher"),
+            tools=[CandidateStoreTool(), SearchTool(), ScrapeTool(), LinkedInTool()],
             allow_delegation=False,
             verbose=True
         )
@@ -42,7 +61,8 @@ class RecruitmentCrew:
     def matcher(self) -> Agent:
         return Agent(
             config=self.agents_config['matcher'],
-            tools=[SerperDevTool(), ScrapeWebsiteTool()],
+            llm=llm_for("recruitment.matcher"),
+            tools=[SearchTool(), ScrapeTool()],
             allow_delegation=False,
             verbose=True
         )
@@ -51,7 +71,8 @@ class RecruitmentCrew:
     def communicator(self) -> Agent:
         return Agent(
             config=self.agents_config['communicator'],
-            tools=[SerperDevTool(), ScrapeWebsiteTool()],
+            llm=llm_for("recruitment.communicator"),
+            tools=[SearchTool(), ScrapeTool()],
             allow_delegation=False,
             verbose=True
         )
@@ -60,6 +81,7 @@ class RecruitmentCrew:
     def reporter(self) -> Agent:
         return Agent(
             config=self.agents_config['reporter'],
+            llm=llm_for("recruitment.reporter"),
             allow_delegation=False,
             verbose=True
         )
@@ -75,19 +97,21 @@ class RecruitmentCrew:
     def match_and_score_candidates_task(self) -> Task:
         return Task(
             config=self.tasks_config['match_and_score_candidates_task'],
-            agent=self.matcher()
+            agent=self.matcher(),
+            context=[self.research_candidates_task()],
         )
 
     @task
     def outreach_strategy_task(self) -> Task:
         return Task(
             config=self.tasks_config['outreach_strategy_task'],
-            agent=self.communicator()
+            agent=self.communicator(),
+            context=[self.research_candidates_task()],
         )
 
     @task
     def report_candidates_task(self) -> Task:
-        return Task(
+        return ReducedContextTask(
             config=self.tasks_config['report_candidates_task'],
             agent=self.reporter(),
             context=[
@@ -100,6 +124,15 @@ class RecruitmentCrew:
     @crew
     def crew(self) -> Crew:
         """Creates the Recruitment crew"""
+        tasks = [
+            self.research_candidates_task(),
+            self.match_and_score_candidates_task(),
+            self.outreach_strategy_task(),
+            self.report_candidates_task()
+        ]
+        if PARALLEL_TASKS:
+            # Matching and outreach only read the research, so they run side by side.
+            plan_parallel_tasks(tasks)
         return Crew(
             agents=[
                 self.researcher(),
@@ -107,13 +140,8 @@ class RecruitmentCrew:
                 self.communicator(),
                 self.reporter()
             ],
-            tasks=[
-                self.research_candidates_task(),
-                self.match_and_score_candidates_task(),
-                self.outreach_strategy_task(),
-                self.report_candidates_task()
-            ],
+            tasks=tasks,
             process=Process.sequential,
             verbose=2,
-            manager_llm=llm
+            manager_llm=llm_for("recruitment.manager")
         )
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import re
+from typing import NamedTuple, Tuple
+
+from recruitment.candidate_store import normalize_skill
+
+LIST_SECTIONS = ("responsibilities", "requirements", "preferred_qualifications", "perks_and_benefits")
+REQUISITION_FIELDS = ("title", "description", *LIST_SECTIONS)
+SKILL_SECTIONS = ("requirements", "preferred_qualifications")
+
+# Lead-ins stripped from a requirement line before it is split into skills.
+SKILL_LEAD_INS = re.compile(
+    r"^(?:(?:proven|solid|strong|hands-on|deep|working|good|excellent|\d+\+? years?(?: of)?)\s+)*"
+    r"(?:experience|proficiency|familiarity|knowledge|understanding|expertise|background|skills?)"
+    r"\s+(?:with|in|of|using)\s+",
+    re.IGNORECASE,
+)
+SKILL_SEPARATORS = re.compile(r"\s*(?:,|;|/|\(|\)|\band\b|\bor\b|\bsuch as\b|\be\.g\.)\s*", re.IGNORECASE)
+MAX_SKILL_WORDS = 3
+
+
+def split_items(text) -> Tuple[str, ...]:
+    """Bullet or line items of a section, without their bullet markers."""
+    if isinstance(text, (list, tuple)):
+        text = "\n".join(str(item) for item in text)
+    items = (re.sub(r"^\s*(?:[-*•]|\d+[.)])\s*", "", line).strip() for line in str(text or "").splitlines())
+    return tuple(item for item in items if item)
+
+
+def extract_skills(lines) -> Tuple[str, ...]:
+    """Short skill phrases named in requirement lines, normalised and de-duplicated in order."""
+    skills = {}
+    for line in lines:
+        line = SKILL_LEAD_INS.sub("", line.rstrip("."))
+        for phrase in SKILL_SEPARATORS.split(line):
+            phrase = normalize_skill(phrase.strip(" .:"))
+            words = phrase.split()
+            if not words or len(words) > MAX_SKILL_WORDS or words[0] in ("a", "an", "the", "related"):
+                continue
+            skills.setdefault(phrase, None)
+    return tuple(skills)
+
+
+def _collapse(text) -> str:
+    return " ".join(str(text or "").split())
+
+
+class JobRequisition(NamedTuple):
+    """A job requirement parsed once from the form, an upload or a dict.
+
+    Sections are stored as tuples of items, so the same requisition typed
+    with different bullets or spacing has the same ``digest``. ``id`` only
+    labels batch entries and is not part of the digest.
+    """
+
+    title: str
+    description: str
+    responsibilities: Tuple[str, ...]
+    requirements: Tuple[str, ...]
+    preferred_qualifications: Tuple[str, ...]
+    perks_and_benefits: Tuple[str, ...]
+    skills: Tuple[str, ...]
+    id: str = ""
+
+    @classmethod
+    def from_dict(cls, raw: dict, id: str = "") -> "JobRequisition":
+        raw = raw.get("job_requirement", raw)
+        sections = {section: split_items(raw.get(section)) for section in LIST_SECTIONS}
+        skills = extract_skills(item for section in SKILL_SECTIONS for item in sections[section])
+        return cls(
+            title=_collapse(raw.get("title")),
+            description=_collapse(raw.get("description")),
+            skills=skills,
+            id=str(raw.get("id") or id),
+            **sections,
+        )
+
+    @property
+    def digest(self) -> str:
+        content = {field: getattr(self, field) for field in REQUISITION_FIELDS}
+        normalized = json.dumps(content, sort_keys=True).lower()
+        return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+    def sections(self) -> dict:
+        """Section name -> plain text, for keyword scoring."""
+        return {field: "\n".join(getattr(self, field)) if field in LIST_SECTIONS else getattr(self, field)
+                for field in REQUISITION_FIELDS}
+
+    # ===== Prompt forms =====
+    # Each task gets only the sections it acts on, as terse bullet lists.
+    def research_prompt(self) -> str:
+        return f"Role: {self.title}\nSkills to search for: {', '.join(self.skills) or self.title}"
+
+    def match_prompt(self) -> str:
+        return "\n".join([
+            f"Role: {self.title}",
+            _bullets("Must have", self.requirements),
+            _bullets("Nice to have", self.preferred_qualifications),
+        ])
+
+    def outreach_prompt(self) -> str:
+        return "\n".join([
+            f"Role: {self.title}",
+            f"About: {self.description}",
+            _bullets("Day to day", self.responsibilities),
+            _bullets("Offer", self.perks_and_benefits),
+        ])
+
+
+def _bullets(heading: str, items) -> str:
+    return f"{heading}:\n" + "\n".join(f"- {item}" for item in items) if items else f"{heading}: none listed"
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from os import environ as env
+
+FRESHNESS_SECONDS = float(env.get("RECRUITMENT_RESULT_TTL_SECONDS", 60 * 60))
+MAX_RESULTS = int(env.get("RECRUITMENT_MAX_RESULTS", 128))
+
+
+class ResultCache:
+    """Finished recruitment runs keyed on the requisition digest.
+
+    An identical requisition is served from here within the freshness
+    window; one submitted while the same requisition is running waits for
+    that run instead of starting another.
+    """
+
+    def __init__(self, freshness: float = FRESHNESS_SECONDS, max_results: int = MAX_RESULTS):
+        self.freshness = freshness
+        self.max_results = max_results
+        self._results = OrderedDict()  # digest -> (finished_at, value)
+        self._run_locks = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: str):
+        with self._lock:
+            entry = self._results.get(digest)
+            if entry is None or time.time() - entry[0] > self.freshness:
+                return None
+            self._results.move_to_end(digest)
+            return entry[1]
+
+    def put(self, digest: str, value):
+        with self._lock:
+            self._results[digest] = (time.time(), value)
+            self._results.move_to_end(digest)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def get_or_run(self, digest: str, run):
+        """Return ``(value, cached)``; ``run()`` is called only on a miss."""
+        with self._lock:
+            run_lock = self._run_locks[digest]
+        with run_lock:
+            value = self.get(digest)
+            with self._lock:
+                if value is not None:
+                    self.hits += 1
+                    return value, True
+                self.misses += 1
+            value = run()
+            self.put(digest, value)
+            return value, False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"results": len(self._results), "hits": self.hits, "misses": self.misses}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache()
+        return _cache
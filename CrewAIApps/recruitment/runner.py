@@ -0,0 +1,71 @@
+from os import environ as env
+
+from recruitment.crew import RecruitmentCrew
+from recruitment.candidate_store import get_candidate_store
+from recruitment.context_reduction import PROFILE_LINK, extract_candidates
+from recruitment.requisition import JobRequisition
+from recruitment.result_cache import get_result_cache
+from recruitment.scoring import format_shortlist, rank_candidates
+from recruitment.scheduling import TaskTimeline
+from services.crew_registry import get_crew_registry
+
+PRESCORE_TOP_N = int(env.get("RECRUITMENT_PRESCORE_TOP_N", 15))
+
+
+def prescore_candidates(requisition: JobRequisition, research_output: str, top_n: int = PRESCORE_TOP_N) -> str:
+    # Ranks the candidates this run's research found locally, so the matcher starts from the top-N.
+    candidates = get_candidate_store().by_links(PROFILE_LINK.findall(research_output))
+    # Score on the skills the researcher read off each profile; the store only
+    # knows which searches found a candidate.
+    researched = {c["link"].lower(): c for c in extract_candidates([research_output]).values() if "link" in c}
+    for candidate in candidates:
+        skills = researched.get(candidate["profile_link"].lower(), {}).get("skills")
+        if skills:
+            candidate["skills"] = skills
+    ranked = rank_candidates(requisition.sections(), candidates, top_n)
+    return format_shortlist(ranked)
+
+
+def attach_shortlist(crew, requisition: JobRequisition):
+    """Append the pre-scored research results to the match task once research finishes.
+
+    The research task runs synchronously before matching (see
+    ``RecruitmentCrew.crew``), so its callback completes before the match
+    task builds its prompt.
+    """
+    research, match = crew.tasks[0], crew.tasks[1]
+
+    def research_finished(output):
+        shortlist = prescore_candidates(requisition, str(getattr(output, "raw", output) or ""))
+        match.description = (
+            f"{match.description}\n\nPre-scored shortlist of the researched candidates "
+            f"(keyword relevance to the job, 0-100, best first):\n{shortlist}"
+        )
+
+    research.callback = research_finished
+
+
+def recruitment_inputs(requisition: JobRequisition) -> dict:
+    return {
+        "job_brief": requisition.research_prompt(),
+        "job_requirements": requisition.match_prompt(),
+        "job_pitch": requisition.outreach_prompt(),
+    }
+
+
+def kickoff_recruitment(requisition: JobRequisition):
+    # The YAML configs are read and the crew is built once per process.
+    crew = get_crew_registry().get("recruitment", lambda: RecruitmentCrew().crew())
+    timeline = TaskTimeline.attach(crew)
+    attach_shortlist(crew, requisition)
+    result = crew.kickoff(inputs=recruitment_inputs(requisition))
+    return str(result), timeline
+
+
+def run_recruitment_ai(requisition: JobRequisition):
+    """Return ``(report, timeline, cached)``; identical requisitions reuse a fresh report."""
+    def run():
+        return kickoff_recruitment(requisition)
+
+    (report, timeline), cached = get_result_cache().get_or_run(requisition.digest, run)
+    return report, timeline, cached
@@ -0,0 +1,126 @@
+import threading
+import time
+from functools import partial
+from os import environ as env
+
+PARALLEL_TASKS = env.get("RECRUITMENT_PARALLEL_TASKS", "1") != "0"
+
+
+def task_dependencies(tasks) -> list:
+    """Per task, the indices of the tasks it reads: its explicit ``context``, else the task before it."""
+    index = {id(task): i for i, task in enumerate(tasks)}
+    dependencies = []
+    for i, task in enumerate(tasks):
+        context = getattr(task, "context", None)
+        if isinstance(context, list):
+            dependencies.append({index[id(dep)] for dep in context if index.get(id(dep), i) < i})
+        else:
+            dependencies.append({i - 1} if i else set())
+    return dependencies
+
+
+def parallel_groups(tasks) -> list:
+    """Runs of consecutive tasks at the same depth of the context DAG, as lists of indices."""
+    dependencies = task_dependencies(tasks)
+    depths, groups = [], []
+    for i, deps in enumerate(dependencies):
+        depths.append(1 + max((depths[j] for j in deps), default=-1))
+        if groups and depths[groups[-1][0]] == depths[i] and not deps & set(groups[-1]):
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+    return groups
+
+
+def plan_parallel_tasks(tasks):
+    """Mark independent tasks ``async_execution`` so the sequential process overlaps them.
+
+    The sequential process dispatches async tasks back to back and joins them
+    before the next sync task, so a group only goes async when all of its
+    dependencies are sync (their output exists at dispatch) and a sync task
+    follows to collect it. Returns ``tasks``.
+    """
+    dependencies = task_dependencies(tasks)
+    for group in parallel_groups(tasks):
+        if len(group) < 2 or group[-1] == len(tasks) - 1:
+            continue
+        if any(tasks[j].async_execution for i in group for j in dependencies[i]):
+            continue
+        for i in group:
+            tasks[i].async_execution = True
+    return tasks
+
+
+def _role(agent) -> str:
+    return str(getattr(agent, "role", agent) or "").strip()
+
+
+class TaskTimeline:
+    """When each task of one kickoff became ready, took its first agent step and finished.
+
+    Seconds are relative to kickoff. A task is ready once everything in its
+    context has finished; ``overlap_seconds`` is how much task time ran
+    concurrently with other tasks instead of end to end.
+    """
+
+    def __init__(self, tasks):
+        self.started = time.perf_counter()
+        self.dependencies = task_dependencies(tasks)
+        self.names = [getattr(task, "name", None) or _role(task.agent) for task in tasks]
+        self.roles = [_role(task.agent) for task in tasks]
+        self.parallel = [bool(task.async_execution) for task in tasks]
+        self._first_step = {}  # role -> seconds
+        self._finished = {}  # task index -> seconds
+        self._lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, crew) -> "TaskTimeline":
+        timeline = cls(crew.tasks)
+        crew.task_callback = timeline.task_finished
+        for agent in crew.agents:
+            agent.step_callback = partial(timeline.agent_step, _role(agent))
+        return timeline
+
+    def _now(self) -> float:
+        return time.perf_counter() - self.started
+
+    def agent_step(self, role, step=None):
+        with self._lock:
+            self._first_step.setdefault(role, self._now())
+
+    def task_finished(self, output):
+        role = _role(getattr(output, "agent", ""))
+        with self._lock:
+            for i, task_role in enumerate(self.roles):
+                if task_role == role and i not in self._finished:
+                    self._finished[i] = self._now()
+                    break
+
+    def rows(self) -> list:
+        with self._lock:
+            finished = dict(self._finished)
+            first_step = dict(self._first_step)
+        rows = []
+        for i, name in enumerate(self.names):
+            ready = max((finished.get(j, 0.0) for j in self.dependencies[i]), default=0.0)
+            done = finished.get(i)
+            rows.append({
+                "task": name,
+                "parallel": self.parallel[i],
+                "ready_s": round(ready, 2),
+                "first_step_s": round(first_step[self.roles[i]], 2) if self.roles[i] in first_step else None,
+                "finished_s": round(done, 2) if done is not None else None,
+                "duration_s": round(done - ready, 2) if done is not None else None,
+            })
+        return rows
+
+    def stats(self) -> dict:
+        rows = self.rows()
+        durations = [row["duration_s"] for row in rows if row["duration_s"] is not None]
+        wall = max((row["finished_s"] for row in rows if row["finished_s"] is not None), default=0.0)
+        return {
+            "tasks": len(rows),
+            "wall_seconds": round(wall, 2),
+            "task_seconds": round(sum(durations), 2),
+            "overlap_seconds": round(max(sum(durations) - wall, 0.0), 2),
+        }
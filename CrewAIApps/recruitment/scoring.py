@@ -0,0 +1,108 @@
+import re
+from collections import Counter
+
+import numpy as np
+
+# How much each job requirement section counts towards a candidate's score.
+SECTION_WEIGHTS = {
+    "title": 1.5,
+    "requirements": 1.0,
+    "responsibilities": 0.5,
+    "preferred_qualifications": 0.5,
+    "description": 0.25,
+}
+CANDIDATE_FIELDS = ("position", "skills", "summary", "name", "location")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or our the to we with will you your
+experience knowledge familiarity understanding proven strong ability skills including such using
+""".split())
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text) -> list:
+    # Keeps tech tokens like c++, c#, node.js and ci/cd intact.
+    tokens = re.findall(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]", str(text or "").lower())
+    return [token for token in tokens if token not in STOP_WORDS]
+
+
+def query_weights(job_requirements: dict, section_weights=SECTION_WEIGHTS) -> dict:
+    """Term -> weight, summed over sections as section weight x term count."""
+    weights = Counter()
+    for section, section_weight in section_weights.items():
+        for term, count in Counter(tokenize(job_requirements.get(section))).items():
+            weights[term] += section_weight * count
+    return dict(weights)
+
+
+def candidate_text(candidate: dict) -> str:
+    return " ".join(str(candidate.get(field) or "") for field in CANDIDATE_FIELDS)
+
+
+def score_candidates(job_requirements: dict, candidates, section_weights=SECTION_WEIGHTS):
+    """BM25 score of every candidate against the weighted job query, scaled to 0-100.
+
+    Only query terms get columns, so the term-frequency matrix stays
+    (candidates x query terms) however large the candidates' vocabulary is.
+    100 means an average-length profile containing every query term that
+    occurs anywhere in the pool; terms no candidate mentions (boilerplate
+    like "build" or "high-quality") cannot be matched, so they do not count
+    against anyone.
+
+    Candidates' ``skills`` should come from their profiles. The store's
+    skill tags are the searches that found them, so scoring on those alone
+    mostly measures which queries ran.
+    """
+    weights = query_weights(job_requirements, section_weights)
+    if not weights or not candidates:
+        return np.zeros(len(candidates), dtype=np.float32)
+    terms = list(weights)
+    column = {term: index for index, term in enumerate(terms)}
+
+    tf = np.zeros((len(candidates), len(terms)), dtype=np.float32)
+    lengths = np.empty(len(candidates), dtype=np.float32)
+    for row, candidate in enumerate(candidates):
+        tokens = tokenize(candidate_text(candidate))
+        lengths[row] = len(tokens)
+        for token in tokens:
+            index = column.get(token)
+            if index is not None:
+                tf[row, index] += 1
+
+    n = len(candidates)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log1p((n - df + 0.5) / (df + 0.5)).astype(np.float32)
+    avg_length = max(float(lengths.mean()), 1.0)
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length)
+    saturated = tf * (BM25_K1 + 1) / (tf + norm[:, None])
+
+    query = np.asarray([weights[term] for term in terms], dtype=np.float32) * idf
+    raw = saturated @ query
+    ideal = float(query[df > 0].sum()) or 1.0
+    return np.minimum(raw / ideal * 100, 100).astype(np.float32)
+
+
+def rank_candidates(job_requirements: dict, candidates, top_n: int = 20, section_weights=SECTION_WEIGHTS):
+    """Return the ``top_n`` ``(score, candidate)`` pairs, best first."""
+    candidates = list(candidates)
+    scores = score_candidates(job_requirements, candidates, section_weights)
+    if not len(scores):
+        return []
+    top_n = min(top_n, len(candidates))
+    top = np.argpartition(-scores, top_n - 1)[:top_n]
+    top = top[np.argsort(-scores[top])]
+    return [(round(float(scores[i]), 1), candidates[i]) for i in top]
+
+
+def format_shortlist(ranked) -> str:
+    if not ranked:
+        return "None of the researched candidates are in the candidate store yet; score them from the research output."
+    lines = []
+    for rank, (score, candidate) in enumerate(ranked, start=1):
+        lines.append(
+            f"{rank}. {candidate.get('name', '')} | {candidate.get('position') or ''} | "
+            f"{candidate.get('location') or ''} | {candidate.get('profile_link', '')} | pre-score {score}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,128 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from os import environ as env
+
+from .driver import Driver
+
+POOL_SIZE = int(env.get("BROWSER_POOL_SIZE", 2))
+MAX_PAGES_PER_SESSION = int(env.get("BROWSER_MAX_PAGES", 50))
+CHECKOUT_TIMEOUT = float(env.get("BROWSER_CHECKOUT_TIMEOUT", 120))
+BROWSER = env.get("BROWSER", "chrome")
+
+
+class BrowserPool:
+    """Long-lived browser sessions, each already on ``url`` with ``cookie`` set.
+
+    Sessions are health-checked on checkout and recycled after ``max_pages``
+    navigations or when returned as broken (e.g. after a WebDriver crash).
+    """
+
+    def __init__(self, url, cookie=None, browser: str = BROWSER, size: int = POOL_SIZE,
+                 max_pages: int = MAX_PAGES_PER_SESSION, factory=None):
+        self.url = url
+        self.cookie = cookie
+        self.browser = browser
+        self.size = size
+        self.max_pages = max_pages
+        self._factory = factory or (lambda: Driver(self.url, self.cookie, self.browser))
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+        self.startup_seconds = 0.0
+
+    def checkout(self, timeout: float = CHECKOUT_TIMEOUT) -> Driver:
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No browser session free after {timeout}s (pool size {self.size})")
+        try:
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._create()
+                if driver.is_alive():
+                    with self._lock:
+                        self.reused += 1
+                    return driver
+                self._discard(driver)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def checkin(self, driver: Driver, broken: bool = False):
+        try:
+            if broken or self._closed or driver.pages_loaded >= self.max_pages:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def session(self, timeout: float = CHECKOUT_TIMEOUT):
+        driver = self.checkout(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not driver.is_alive()
+            raise
+        finally:
+            self.checkin(driver, broken)
+
+    def close_all(self):
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": self._idle.qsize(),
+                "created": self.created,
+                "reused": self.reused,
+                "recycled": self.recycled,
+                "startup_seconds": round(self.startup_seconds, 3),
+            }
+
+    def _create(self) -> Driver:
+        started = time.perf_counter()
+        driver = self._factory()
+        with self._lock:
+            self.created += 1
+            self.startup_seconds += time.perf_counter() - started
+        return driver
+
+    def _discard(self, driver: Driver):
+        with self._lock:
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Browser shutdown failed: {e}")
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(url, cookie=None, browser: str = BROWSER) -> BrowserPool:
+    """Process-wide pool per (url, cookie, browser)."""
+    key = (url, tuple(sorted(cookie.items())) if cookie else None, browser)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = BrowserPool(url, cookie, browser)
+            atexit.register(pool.close_all)
+        return pool
@@ -0,0 +1,22 @@
+import asyncio
+from langchain.tools import BaseTool
+from recruitment.candidate_store import get_candidate_store
+from .linkedin import format_people
+
+
+class CandidateStoreTool(BaseTool):
+    name: str = "lookup_known_candidates"
+    description: str = (
+        "Look up candidates already found in earlier searches, given a list of skills. Comma separated. "
+        "Use this before retrieve_linkedin_profiles; only search LinkedIn for skills this does not cover."
+    )
+
+    def _run(self, skills: str) -> str:
+        people = get_candidate_store().find(skills)
+        if not people:
+            return "No known candidates for these skills."
+        return format_people(people)
+
+    async def _arun(self, skills: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run, skills)
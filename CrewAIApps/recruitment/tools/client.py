@@ -3,16 +3,42 @@ import urllib
 import selenium
 from selenium.webdriver.common.by import By
 
-from .driver import Driver
+from selenium.common.exceptions import WebDriverException
+
+from .browser_pool import get_browser_pool
     
 from os import environ as env
 from dotenv import load_dotenv
 load_dotenv()
 linkedin_cookie = env["LINKEDIN_COOKIE"]
 
+RESULT_CARD_SELECTOR = "ul li div div.linked-area"
+# Shown instead of result cards when a search (or a page past the last one) is empty.
+NO_RESULTS_SELECTOR = "div.search-reusable-search-no-results, section.artdeco-empty-state"
+FIELD_SELECTORS = {
+  "name": "span.entity-result__title-line",
+  "position": "div.entity-result__primary-subtitle",
+  "location": "div.entity-result__secondary-subtitle",
+  "profile_link": "a.app-aware-link",
+}
+
+# Reads every result card in one WebDriver round-trip instead of four per card.
+EXTRACT_PEOPLE_SCRIPT = """
+const [cardSelector, fields] = arguments;
+return Array.from(document.querySelectorAll(cardSelector)).map(card => {
+  const person = {};
+  for (const [field, selector] of Object.entries(fields)) {
+    const element = card.querySelector(selector);
+    if (!element) return null;
+    person[field] = field === "profile_link" ? element.href : element.innerText.trim();
+  }
+  return person;
+}).filter(person => person !== null);
+"""
+
 
 class Client:
-  def __init__(self):
+  def __init__(self, pool=None):
     url = 'https://linkedin.com/'
     cookie = {
       "name": "li_at",
@@ -20,25 +46,64 @@ class Client:
       "domain": ".linkedin.com"
     }
 
-    self.driver = Driver(url, cookie)
+    # Sessions come from a long-lived pool, already logged in via the cookie.
+    self.pool = pool or get_browser_pool(url, cookie)
+    self.driver = self.pool.checkout()
+    self.broken = False
 
-  def find_people(self, skills):
+  def find_people(self, skills, batch=True, pages=1):
+    """People from up to ``pages`` result pages, or None if the first page never loaded."""
     skills = skills.split(",")
     search = " ".join(skills)
     encoded_string = urllib.parse.quote(search.lower())
-    url = f"https://www.linkedin.com/search/results/people/?keywords={encoded_string}"
-    self.driver.navigate(url)
 
-    people = self.driver.get_elements("ul li div div.linked-area")
+    results = []
+    for page in range(1, pages + 1):
+      url = f"https://www.linkedin.com/search/results/people/?keywords={encoded_string}&page={page}"
+      people = self._read_results_page(url, batch)
+      if people is None and page == 1:
+        return None
+      if not people:
+        break
+      results.extend(people)
+    return results
+
+  def _read_results_page(self, url, batch):
+    # None when neither result cards nor the "no results" marker showed up
+    # (timeout, login wall); [] for a genuinely empty page.
+    try:
+      if not self.driver.navigate(url, ready_selector=RESULT_CARD_SELECTOR, empty_selector=NO_RESULTS_SELECTOR):
+        print(f"LinkedIn results page not ready: {url}")
+        return None
+      if not self.driver.get_elements(RESULT_CARD_SELECTOR):
+        return []
+      self.driver.wait_for_count_stable(RESULT_CARD_SELECTOR)
+    except WebDriverException:
+      self.broken = True
+      raise
+
+    if batch:
+      try:
+        return self.extract_people_batch()
+      except WebDriverException as e:
+        print(f"Batch extraction failed, falling back to per-element: {e}")
+    return self.extract_people_per_element()
+
+  def extract_people_batch(self):
+    people = self.driver.execute_script(EXTRACT_PEOPLE_SCRIPT, RESULT_CARD_SELECTOR, FIELD_SELECTORS)
+    return [dict(person) for person in people or []]
+
+  def extract_people_per_element(self):
+    people = self.driver.get_elements(RESULT_CARD_SELECTOR)
 
     results = []
     for person in people:
       try:
         result = {}
-        result["name"] = person.find_element(By.CSS_SELECTOR, "span.entity-result__title-line").text
-        result["position"] = person.find_element(By.CSS_SELECTOR, "div.entity-result__primary-subtitle").text
-        result["location"] = person.find_element(By.CSS_SELECTOR, "div.entity-result__secondary-subtitle").text
-        result["profile_link"] = person.find_element(By.CSS_SELECTOR, "a.app-aware-link").get_attribute("href")
+        result["name"] = person.find_element(By.CSS_SELECTOR, FIELD_SELECTORS["name"]).text
+        result["position"] = person.find_element(By.CSS_SELECTOR, FIELD_SELECTORS["position"]).text
+        result["location"] = person.find_element(By.CSS_SELECTOR, FIELD_SELECTORS["location"]).text
+        result["profile_link"] = person.find_element(By.CSS_SELECTOR, FIELD_SELECTORS["profile_link"]).get_attribute("href")
       except Exception as e:
         print(e)
         continue
@@ -46,4 +111,5 @@ class Client:
     return results
 
   def close(self):
-    self.driver.close()
\ No newline at end of file
+    # Returns the session to the pool; broken sessions are recycled.
+    self.pool.checkin(self.driver, broken=self.broken)
\ No newline at end of file
@@ -1,23 +1,66 @@
-import time
+from os import environ as env
 import selenium
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
+from .waits import (
+    DEFAULT_TIMEOUT,
+    document_ready,
+    element_count_stable,
+    network_idle,
+    ready_timings,
+    scroll_height_stable,
+    selector_present,
+    wait_until,
+)
+
+CHROMEDRIVER_PATH = env.get("CHROMEDRIVER_PATH", "/opt/homebrew/bin/chromedriver")
+# The fixed sleeps these waits replaced, kept for the time-to-ready comparison.
+FIXED_NAVIGATE_WAIT = 3
+FIXED_SCROLL_WAIT = 6
+
 class Driver:
     def __init__(self, url, cookie=None, browser="chrome"):
         self.driver = self._create_driver(url, cookie, browser)
+        self.pages_loaded = 0
+        self._navigate_seconds = 0.0
+
+    def navigate(self, url, ready_selector=None, empty_selector=None, timeout=DEFAULT_TIMEOUT):
+        """Load ``url`` and wait until it is ready instead of sleeping a fixed time.
 
-    def navigate(self, url, wait=3):
+        Ready means the document has loaded, network activity has settled and,
+        when given, ``ready_selector`` or ``empty_selector`` (the page's "no
+        results" marker) matches at least one element. Returns False on timeout.
+        """
         self.driver.get(url)
-        time.sleep(wait)
+        self.pages_loaded += 1
+        conditions = [document_ready(self.driver), network_idle(self.driver)]
+        markers = ", ".join(selector for selector in (ready_selector, empty_selector) if selector)
+        if markers:
+            conditions.append(selector_present(self.driver, markers))
+        satisfied, elapsed = wait_until(lambda: all(condition() for condition in conditions), timeout)
+        self._navigate_seconds = elapsed
+        ready_timings.record(url, elapsed, FIXED_NAVIGATE_WAIT, satisfied)
+        return satisfied
+
+    def scroll_to_bottom(self, timeout=DEFAULT_TIMEOUT):
+        # Keep scrolling until lazily loaded content stops growing the page.
+        satisfied, elapsed = wait_until(self._scroll_and_settle(), timeout)
+        ready_timings.record("scroll_to_bottom", elapsed, FIXED_SCROLL_WAIT, satisfied)
+        return satisfied
+
+    def wait_for_count_stable(self, selector, timeout=DEFAULT_TIMEOUT):
+        satisfied, elapsed = wait_until(element_count_stable(self.driver, selector), timeout)
+        # Results used to be read straight after navigate's fixed sleep, so this wait
+        # replaced whatever part of that sleep the navigate wait did not already use.
+        fixed = max(FIXED_NAVIGATE_WAIT - self._navigate_seconds, 0)
+        ready_timings.record(f"stable:{selector}", elapsed, fixed, satisfied)
+        return satisfied
 
-    def scroll_to_bottom(self, wait=3):
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(wait)
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(wait)
+    def execute_script(self, script, *args):
+        return self.driver.execute_script(script, *args)
 
     def get_element(self, selector):
         return self.driver.find_element(By.CSS_SELECTOR, selector)
@@ -38,7 +81,7 @@ class Driver:
         if browser == "chrome":
             options = ChromeOptions()
             options.add_argument("--headless")  # Uncomment if you want headless Chrome
-            driver = webdriver.Chrome(executable_path='/opt/homebrew/bin/chromedriver', options=options)
+            driver = webdriver.Chrome(executable_path=CHROMEDRIVER_PATH, options=options)
         elif browser == "firefox":
             options = FirefoxOptions()
             options.add_argument("--headless")  # Uncomment if you want headless Firefox
@@ -51,5 +94,23 @@ class Driver:
             driver.add_cookie(cookie)
         return driver
 
+    def _scroll_and_settle(self):
+        settled = scroll_height_stable(self.driver)
+
+        def condition():
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            return settled()
+
+        return condition
+
+    def is_alive(self):
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
     def close(self):
         self.driver.close()
+
+    def quit(self):
+        self.driver.quit()
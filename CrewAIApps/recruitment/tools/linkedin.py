@@ -1,29 +1,134 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import environ as env
+
 from langchain.tools import BaseTool
+from recruitment.candidate_store import get_candidate_store, query_key
 from .client import Client as LinkedinClient
 
+RESULT_PAGES = int(env.get("LINKEDIN_RESULT_PAGES", 2))
+MAX_QUERIES = int(env.get("LINKEDIN_MAX_QUERIES", 4))
+
+# query key -> Future of the scrape in progress, shared by concurrent crews.
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def query_variants(skills: str, max_queries: int = MAX_QUERIES):
+    """The full skill list as one query, then individual skills, de-duplicated."""
+    parts = {}
+    for part in skills.split(","):
+        parts.setdefault(part.strip().lower(), part.strip())
+    parts = [part for key, part in parts.items() if key]
+    variants = [",".join(parts)] if parts else []
+    if len(parts) > 1:
+        variants.extend(parts)
+    return variants[:max_queries]
+
+
+def merge_people(result_lists):
+    """Merge candidate lists, keeping the first occurrence of each profile link."""
+    merged = {}
+    for people in result_lists:
+        for person in people:
+            link = (person.get("profile_link") or "").split("?", 1)[0].rstrip("/")
+            if link and link not in merged:
+                merged[link] = dict(person, profile_link=link)
+    return list(merged.values())
+
+
+def format_people(people):
+    result = [
+        "\n".join([
+            "Person Profile",
+            "-------------",
+            p['name'],
+            p.get('position') or "",
+            p.get('location') or "",
+            p["profile_link"],
+        ]) for p in people
+    ]
+    return "\n\n".join(result)
+
+
 class LinkedInTool(BaseTool):
     name: str = "retrieve_linkedin_profiles"  # Define name with type annotation
     description: str = "Retrieve LinkedIn profiles given a list of skills. Comma separated."  # Define description with type annotation
 
     def _run(self, skills: str) -> str:
-        linkedin_client = LinkedinClient()
-        people = linkedin_client.find_people(skills)
-        people = self._format_people_to_text(people)
-        linkedin_client.close()
-        return people
+        return self._format_people_to_text(self._search(skills))
+
+    async def _arun(self, skills: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run, skills)
+
+    def _search(self, skills: str):
+        # Queries searched recently are answered from the candidate store; only
+        # the gaps are scraped, concurrently, each on its own pooled browser session.
+        variants = query_variants(skills)
+        store = get_candidate_store()
+        result_lists = []
+        gaps = []
+        for variant in variants:
+            people = store.search_results(variant)
+            if people is not None:
+                result_lists.append(people)
+            else:
+                gaps.append(variant)
+
+        if gaps:
+            with ThreadPoolExecutor(max_workers=len(gaps)) as executor:
+                for people in executor.map(self._search_shared, gaps):
+                    if people is not None:
+                        result_lists.append(people)
+        return merge_people(result_lists)
+
+    def _search_shared(self, skills: str):
+        # Crews running side by side (e.g. a batch of requisitions with
+        # overlapping skills) wait for a scrape already in flight instead of
+        # repeating it.
+        key = query_key(skills)
+        with _in_flight_lock:
+            future = _in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = _in_flight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            # None means the scrape failed or the page never loaded; only real
+            # answers (including a genuine "no results") are logged for replay.
+            people = self._search_variant(skills)
+            if people is not None:
+                people = merge_people([people])
+                store = get_candidate_store()
+                store.upsert(people, skills)
+                store.record_search(skills, people)
+            future.set_result(people)
+            return people
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(key, None)
 
-    def _arun(self, skills: str):
-        raise NotImplementedError("Async support not implemented.")
+    def _search_variant(self, skills: str):
+        # Blocks until the browser pool has a free session, which bounds the fan-out.
+        try:
+            linkedin_client = LinkedinClient()
+        except Exception as e:
+            print(f"No LinkedIn session for '{skills}': {e}")
+            return None
+        try:
+            return linkedin_client.find_people(skills, pages=RESULT_PAGES)
+        except Exception as e:
+            print(f"LinkedIn search for '{skills}' failed: {e}")
+            return None
+        finally:
+            linkedin_client.close()
 
     def _format_people_to_text(self, people):
-        result = [
-            "\n".join([
-                "Person Profile",
-                "-------------",
-                p['name'],
-                p['position'],
-                p['location'],
-                p["profile_link"],
-            ]) for p in people
-        ]
-        return "\n\n".join(result)
+        return format_people(people)
@@ -0,0 +1,93 @@
+import threading
+import time
+from os import environ as env
+
+from selenium.webdriver.common.by import By
+
+DEFAULT_TIMEOUT = float(env.get("BROWSER_WAIT_TIMEOUT", 10))
+POLL_INTERVAL = float(env.get("BROWSER_POLL_INTERVAL", 0.1))
+SETTLE_SECONDS = float(env.get("BROWSER_SETTLE_SECONDS", 0.5))
+
+
+def wait_until(condition, timeout: float = DEFAULT_TIMEOUT, poll: float = POLL_INTERVAL):
+    """Poll ``condition()`` until it is truthy; returns ``(satisfied, elapsed_seconds)``."""
+    started = time.monotonic()
+    while True:
+        try:
+            if condition():
+                return True, time.monotonic() - started
+        except Exception:
+            pass
+        elapsed = time.monotonic() - started
+        if elapsed >= timeout:
+            return False, elapsed
+        time.sleep(poll)
+
+
+def _stable(read, settle: float):
+    """Condition that holds once ``read()`` has returned the same value for ``settle`` seconds."""
+    state = {"value": object(), "since": time.monotonic()}
+
+    def condition():
+        value = read()
+        now = time.monotonic()
+        if value != state["value"]:
+            state["value"], state["since"] = value, now
+            return False
+        return now - state["since"] >= settle
+
+    return condition
+
+
+# ===== Conditions =====
+def document_ready(driver):
+    return lambda: driver.execute_script("return document.readyState") == "complete"
+
+
+def selector_present(driver, selector):
+    return lambda: len(driver.find_elements(By.CSS_SELECTOR, selector)) > 0
+
+
+def element_count_stable(driver, selector, settle: float = SETTLE_SECONDS):
+    return _stable(lambda: len(driver.find_elements(By.CSS_SELECTOR, selector)), settle)
+
+
+def scroll_height_stable(driver, settle: float = SETTLE_SECONDS):
+    return _stable(lambda: driver.execute_script("return document.body.scrollHeight"), settle)
+
+
+def network_idle(driver, settle: float = SETTLE_SECONDS):
+    # No new resource timing entries for ``settle`` seconds.
+    return _stable(lambda: driver.execute_script("return performance.getEntriesByType('resource').length"), settle)
+
+
+# ===== Instrumentation =====
+class ReadyTimings:
+    """Actual time-to-ready per page next to the fixed sleep it replaced."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._samples = []  # (label, ready_seconds, fixed_seconds, satisfied)
+        self._lock = threading.Lock()
+
+    def record(self, label, ready_seconds, fixed_seconds, satisfied=True):
+        with self._lock:
+            self._samples.append((label, ready_seconds, fixed_seconds, satisfied))
+            del self._samples[:-self.max_samples]
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = list(self._samples)
+        ready = sum(sample[1] for sample in samples)
+        fixed = sum(sample[2] for sample in samples)
+        return {
+            "pages": len(samples),
+            "timeouts": sum(1 for sample in samples if not sample[3]),
+            "ready_seconds": round(ready, 3),
+            "fixed_sleep_seconds": round(fixed, 3),
+            "saved_seconds": round(fixed - ready, 3),
+            "avg_ready_seconds": round(ready / len(samples), 3) if samples else 0.0,
+        }
+
+
+ready_timings = ReadyTimings()
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from os import environ as env
+
+
+def config_key(config) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class CrewRegistry:
+    """Builds each crew template once per process and hands out per-request copies.
+
+    Templates must keep request data out of their agents and tasks (use
+    ``{placeholders}`` filled by ``kickoff(inputs=...)``); ``config`` is only
+    for settings that change the crew's shape, and is part of the cache key.
+
+    Hooks are called as ``hook(event)`` with a dict holding ``name``, ``key``,
+    ``built`` (whether this call built the template), ``build_seconds``,
+    ``copy_seconds`` and ``saved_seconds``.
+    """
+
+    def __init__(self):
+        self._templates = {}  # (name, key) -> (template, build_seconds)
+        self._build_locks = {}  # (name, key) -> Lock, created under self._lock
+        self._lock = threading.Lock()
+        self._hooks = []
+        self.saved_seconds = defaultdict(float)
+        self.requests = defaultdict(int)
+
+    def add_hook(self, hook):
+        self._hooks.append(hook)
+
+    def get(self, name: str, factory, config=None):
+        key = config_key(config)
+        built = False
+        with self._lock:
+            build_lock = self._build_locks.setdefault((name, key), threading.Lock())
+        with build_lock:
+            entry = self._templates.get((name, key))
+            if entry is None:
+                started = time.perf_counter()
+                template = factory() if config is None else factory(**config)
+                entry = (template, time.perf_counter() - started)
+                with self._lock:
+                    self._templates[(name, key)] = entry
+                built = True
+        template, build_seconds = entry
+
+        started = time.perf_counter()
+        instance = template.copy()
+        copy_seconds = time.perf_counter() - started
+        saved_seconds = 0.0 if built else max(build_seconds - copy_seconds, 0.0)
+
+        with self._lock:
+            self.requests[name] += 1
+            self.saved_seconds[name] += saved_seconds
+        event = {
+            "name": name,
+            "key": key,
+            "built": built,
+            "build_seconds": build_seconds,
+            "copy_seconds": copy_seconds,
+            "saved_seconds": saved_seconds,
+        }
+        for hook in self._hooks:
+            hook(event)
+        return instance
+
+    def invalidate(self, name: str = None):
+        with self._lock:
+            for template_name, key in list(self._templates):
+                if name is None or template_name == name:
+                    del self._templates[(template_name, key)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                name: {"requests": self.requests[name], "saved_seconds": round(self.saved_seconds[name], 4)}
+                for name in self.requests
+            }
+
+
+def log_event(event):
+    """Hook that prints every build or reuse; installed when CREW_REGISTRY_LOG is set to a non-empty value."""
+    action = "built" if event["built"] else "reused"
+    print(
+        f"[crew-registry] {event['name']} {action}: build {event['build_seconds'] * 1000:.1f} ms, "
+        f"copy {event['copy_seconds'] * 1000:.1f} ms, saved {event['saved_seconds'] * 1000:.1f} ms"
+    )
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_crew_registry() -> CrewRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CrewRegistry()
+            if env.get("CREW_REGISTRY_LOG"):
+                _registry.add_hook(log_event)
+        return _registry
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from os import environ as env
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "llm_cache.sqlite3"
+MAX_BYTES = int(float(env.get("LLM_CACHE_MAX_MB", 256)) * 1024 * 1024)
+SEMANTIC_CACHE = env.get("LLM_SEMANTIC_CACHE", "0") == "1"
+SEMANTIC_THRESHOLD = float(env.get("LLM_SEMANTIC_THRESHOLD", 0.95))
+SEMANTIC_MAX_QUESTION_CHARS = int(env.get("LLM_SEMANTIC_MAX_QUESTION_CHARS", 1000))
+BYPASS = env.get("LLM_CACHE_BYPASS", "0") == "1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    response TEXT NOT NULL,
+    embedding BLOB,
+    latency REAL NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_scope ON responses(scope);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+
+def request_key(model: str, temperature, prompt: str, stop=None) -> str:
+    payload = json.dumps({"model": model, "temperature": temperature, "prompt": prompt, "stop": stop}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Exact-match, then optionally embedding-similarity, cache of LLM responses.
+
+    Responses live in SQLite so they survive restarts; once the stored bytes
+    exceed ``max_bytes`` the least recently used entries are evicted.
+
+    The semantic tier embeds only the question, and only matches entries
+    with the same ``scope`` (model and temperature) and exactly the same
+    context (system prompt, history, documents); it needs cosine similarity
+    of at least ``threshold``. Questions longer than ``max_question_chars``
+    usually carry their own documents, so those are matched exactly only.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes: int = MAX_BYTES, semantic: bool = SEMANTIC_CACHE,
+                 threshold: float = SEMANTIC_THRESHOLD, max_question_chars: int = SEMANTIC_MAX_QUESTION_CHARS,
+                 embedder=None):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.semantic = semantic
+        self.threshold = threshold
+        self.max_question_chars = max_question_chars
+        self._embedder = embedder
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._vectors = {}  # scope -> (keys, normalised matrix), loaded on first semantic lookup
+
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            from chatbot.vector_index import HashingEmbedder
+
+            self._embedder = HashingEmbedder()
+        return self._embedder
+
+    def _embed(self, text: str):
+        vector = np.asarray(self.embedder.embed([text])[0], dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _semantic(self, scope, context, question):
+        """``(semantic scope, question vector)``, or ``(scope, None)`` when the semantic tier does not apply."""
+        if not self.semantic or not question or len(question) > self.max_question_chars:
+            return scope, None
+        return f"{scope}:{hashlib.sha256(context.encode()).hexdigest()[:16]}", self._embed(question)
+
+    def _scope_vectors(self, scope):
+        # Called with the lock held.
+        if scope not in self._vectors:
+            rows = self._conn.execute(
+                "SELECT key, embedding FROM responses WHERE scope = ? AND embedding IS NOT NULL", (scope,)
+            ).fetchall()
+            keys = [row[0] for row in rows]
+            matrix = np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows]) if rows else None
+            self._vectors[scope] = (keys, matrix)
+        return self._vectors[scope]
+
+    def _touch(self, key):
+        # Called with the lock held; returns (response, latency) or None.
+        row = self._conn.execute("SELECT response, latency FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            with self._conn:
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row
+
+    def lookup(self, key: str, scope: str, context: str, question: str):
+        """Return ``(response, kind)`` with kind "exact" or "semantic", or ``(None, None)``."""
+        scope, vector = self._semantic(scope, context, question)
+        with self._lock:
+            row = self._touch(key)
+            if row is not None:
+                self.exact_hits += 1
+                self.saved_seconds += row[1]
+                return row[0], "exact"
+            if vector is not None:
+                keys, matrix = self._scope_vectors(scope)
+                if matrix is not None and matrix.shape[1] == vector.shape[0]:
+                    similarities = matrix @ vector
+                    best = int(np.argmax(similarities))
+                    if similarities[best] >= self.threshold:
+                        row = self._touch(keys[best])
+                        if row is not None:
+                            self.semantic_hits += 1
+                            self.saved_seconds += row[1]
+                            return row[0], "semantic"
+            self.misses += 1
+        return None, None
+
+    def put(self, key: str, scope: str, context: str, question: str, response: str, latency: float):
+        scope, vector = self._semantic(scope, context, question)
+        blob = vector.tobytes() if vector is not None else None
+        size = len(response.encode()) + (len(blob) if blob else 0)
+        now = time.time()
+        with self._lock, self._conn:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, scope, response, embedding, latency, size, created, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, scope, response, blob, latency, size, now, now),
+            )
+            self.total_bytes += size - (old[0] if old else 0)
+            if vector is not None and scope in self._vectors and old is None:
+                keys, matrix = self._vectors[scope]
+                matrix = vector[None, :] if matrix is None else np.vstack([matrix, vector])
+                self._vectors[scope] = (keys + [key], matrix)
+            self._evict()
+
+    def _evict(self):
+        # Called with the lock held, inside a transaction.
+        while self.total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.total_bytes -= size
+                self.evictions += 1
+                if self.total_bytes <= self.max_bytes:
+                    break
+            self._vectors.clear()
+
+    def record_bypass(self):
+        with self._lock:
+            self.bypassed += 1
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self.total_bytes = 0
+            self._vectors.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "evictions": self.evictions,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+                "bytes": self.total_bytes,
+            }
+
+
+def cache_key(llm, prompt, stop=None):
+    """``(key, scope)`` for a prompt (or message list) to ``llm``, keyed on its model and temperature."""
+    model = getattr(llm, "model", None) or getattr(llm, "model_name", None) or llm.llm_type
+    temperature = getattr(llm, "temperature", None)
+    return request_key(model, temperature, prompt, stop), f"{model}:{temperature}"
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(env.get("LLM_CACHE_PATH", str(DEFAULT_CACHE_PATH)))
+        return _cache
@@ -0,0 +1,168 @@
+import bisect
+import threading
+import time
+from collections import defaultdict, deque
+from os import environ as env
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import yaml
+
+from services.stats import percentile
+
+DEFAULT_ROUTES_PATH = Path(__file__).parent.parent / "config" / "models.yaml"
+MIN_SAMPLES = int(env.get("MODEL_ROUTER_MIN_SAMPLES", 20))
+PROBE_EVERY = int(env.get("MODEL_ROUTER_PROBE_EVERY", 10))
+RECOVER_AFTER = int(env.get("MODEL_ROUTER_RECOVER_AFTER", 3))
+WINDOW = int(env.get("MODEL_ROUTER_WINDOW", 200))
+BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class Route(NamedTuple):
+    name: str
+    model: str
+    fallback: Optional[str]
+    p95_budget_seconds: float
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram plus a sliding window for percentiles."""
+
+    def __init__(self, buckets=BUCKETS, window: int = WINDOW):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.recent = deque(maxlen=window)
+        self.errors = 0
+
+    def observe(self, seconds: float, ok: bool = True):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.recent.append(seconds)
+        if not ok:
+            self.errors += 1
+
+    def percentile(self, p: float) -> float:
+        return percentile(self.recent, p)
+
+    def snapshot(self) -> dict:
+        labels = [f"<={bound}s" for bound in self.buckets] + [f">{self.buckets[-1]}s"]
+        return {
+            "count": sum(self.counts),
+            "errors": self.errors,
+            "p50_seconds": round(self.percentile(0.5), 3),
+            "p95_seconds": round(self.percentile(0.95), 3),
+            "buckets": {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+
+class ModelRouter:
+    """Picks a model per route and falls back to a faster one when the route runs slow.
+
+    A route degrades once its primary model's p95 over the last ``WINDOW``
+    calls (with at least ``min_samples``) exceeds its budget; the primary's
+    window is then cleared so the slow spell is not held against it later.
+    While degraded, one request in ``probe_every`` still goes to the
+    primary, and ``recover_after`` consecutive probes within budget bring
+    the route back.
+    """
+
+    def __init__(self, routes: dict, defaults: dict, min_samples: int = MIN_SAMPLES, probe_every: int = PROBE_EVERY,
+                 recover_after: int = RECOVER_AFTER):
+        self.defaults = defaults
+        self.routes = routes
+        self.min_samples = min_samples
+        self.probe_every = probe_every
+        self.recover_after = recover_after
+        self._histograms = defaultdict(LatencyHistogram)  # (route, model) -> histogram
+        self._requests = defaultdict(int)
+        self._fallbacks = defaultdict(int)
+        self._degraded = {}  # route -> consecutive probes within budget
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_yaml(cls, path=DEFAULT_ROUTES_PATH, **kwargs) -> "ModelRouter":
+        with open(path, "r") as f:
+            config = yaml.safe_load(f) or {}
+        return cls(config.get("routes") or {}, config.get("defaults") or {}, **kwargs)
+
+    def route(self, name: str) -> Route:
+        settings = dict(self.defaults)
+        parts = name.split(".")
+        # Area settings first, then the more specific route overrides them.
+        for depth in range(1, len(parts) + 1):
+            settings.update(self.routes.get(".".join(parts[:depth])) or {})
+        return Route(
+            name=name,
+            model=settings.get("model", "gpt-4"),
+            fallback=settings.get("fallback"),
+            p95_budget_seconds=float(settings.get("p95_budget_seconds", 60)),
+        )
+
+    def choose(self, name: str) -> str:
+        route = self.route(name)
+        with self._lock:
+            self._requests[name] += 1
+            if not route.fallback or route.fallback == route.model:
+                return route.model
+            if name in self._degraded and self._requests[name] % self.probe_every:
+                self._fallbacks[name] += 1
+                return route.fallback
+            return route.model
+
+    def record(self, name: str, model: str, seconds: float, ok: bool = True):
+        route = self.route(name)
+        with self._lock:
+            primary = self._histograms[(name, model)]
+            primary.observe(seconds, ok)
+            if model != route.model or not route.fallback or route.fallback == route.model:
+                return
+            if name in self._degraded:
+                # A probe: recovery needs a run of fast ones, not a p95 over the old slow samples.
+                within = ok and seconds <= route.p95_budget_seconds
+                self._degraded[name] = self._degraded[name] + 1 if within else 0
+                if self._degraded[name] >= self.recover_after:
+                    del self._degraded[name]
+                    primary.recent.clear()
+            elif len(primary.recent) >= self.min_samples and primary.percentile(0.95) > route.p95_budget_seconds:
+                self._degraded[name] = 0
+                primary.recent.clear()
+
+    def degraded(self) -> list:
+        with self._lock:
+            return sorted(self._degraded)
+
+    def call(self, name: str, fn, **kwargs):
+        """``fn(model=<routed model>, **kwargs)``, timed and recorded against the route."""
+        model = self.choose(name)
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = fn(model=model, **kwargs)
+            ok = True
+            return result
+        finally:
+            self.record(name, model, time.perf_counter() - started, ok)
+
+    def stats(self) -> dict:
+        with self._lock:
+            routes = {}
+            for (name, model), histogram in sorted(self._histograms.items()):
+                route = routes.setdefault(name, {
+                    "requests": self._requests[name],
+                    "fallbacks": self._fallbacks[name],
+                    "degraded": name in self._degraded,
+                    "models": {},
+                })
+                route["models"][model] = histogram.snapshot()
+            return routes
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter.from_yaml(env.get("MODEL_ROUTES_PATH", str(DEFAULT_ROUTES_PATH)))
+        return _router
@@ -0,0 +1,241 @@
+import importlib.util
+import random
+import threading
+import time
+from collections import defaultdict
+from functools import partial
+from os import environ as env
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+MAX_CONNECTIONS = int(env.get("OPENAI_MAX_CONNECTIONS", 20))
+MAX_KEEPALIVE = int(env.get("OPENAI_MAX_KEEPALIVE", 10))
+KEEPALIVE_SECONDS = float(env.get("OPENAI_KEEPALIVE_SECONDS", 60))
+TIMEOUT_SECONDS = float(env.get("OPENAI_TIMEOUT_SECONDS", 60))
+DEFAULT_CONCURRENCY = int(env.get("OPENAI_DEFAULT_CONCURRENCY", 8))
+MAX_RETRIES = int(env.get("OPENAI_MAX_RETRIES", 4))
+BACKOFF_BASE = float(env.get("OPENAI_BACKOFF_BASE", 0.5))
+BACKOFF_CAP = float(env.get("OPENAI_BACKOFF_CAP", 20))
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]").
+HTTP2 = env.get("OPENAI_HTTP2", "1") == "1" and importlib.util.find_spec("h2") is not None
+
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+def parse_concurrency(spec: str) -> dict:
+    """``"gpt-4=4,gpt-4o-mini=8"`` -> ``{"gpt-4": 4, "gpt-4o-mini": 8}``."""
+    limits = {}
+    for part in spec.split(","):
+        model, _, limit = part.partition("=")
+        if model.strip() and limit.strip().isdigit():
+            limits[model.strip()] = int(limit)
+    return limits
+
+
+MODEL_CONCURRENCY = parse_concurrency(env.get("OPENAI_MODEL_CONCURRENCY", "gpt-4=4,gpt-4o=6,gpt-4o-mini=8"))
+
+
+def backoff_delay(attempt: int, error=None, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Full-jitter exponential backoff, or the server's Retry-After when it sends one."""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), cap)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class LimitedStream:
+    """A streamed response that holds its model's concurrency slot until read to the end or closed."""
+
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+        self._released = False
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        try:
+            yield from self._stream
+        finally:
+            self.close()
+
+    def close(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        try:
+            close = getattr(self._stream, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        if "_lock" in self.__dict__:
+            self.close()
+
+    def __getattr__(self, name):
+        return getattr(self.__dict__["_stream"], name)
+
+
+class ModelLimiter:
+    """Caps concurrent requests per model and retries transient failures."""
+
+    def __init__(self, limits=None, default: int = DEFAULT_CONCURRENCY, max_retries: int = MAX_RETRIES, sleep=time.sleep):
+        self.limits = dict(MODEL_CONCURRENCY if limits is None else limits)
+        self.default = default
+        self.max_retries = max_retries
+        self._sleep = sleep
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        self.calls = defaultdict(int)
+        self.retries = defaultdict(int)
+        self.queued_seconds = defaultdict(float)
+
+    def _semaphore(self, model):
+        with self._lock:
+            semaphore = self._semaphores.get(model)
+            if semaphore is None:
+                semaphore = self._semaphores[model] = threading.BoundedSemaphore(self.limits.get(model, self.default))
+            return semaphore
+
+    def call(self, fn, *args, **kwargs):
+        model = kwargs.get("model", "default")
+        semaphore = self._semaphore(model)
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            semaphore.acquire()
+            queued = time.perf_counter() - started
+            with self._lock:
+                self.calls[model] += 1
+                self.queued_seconds[model] += queued
+            try:
+                result = fn(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                semaphore.release()
+                if attempt >= self.max_retries:
+                    raise
+                delay = backoff_delay(attempt, e)
+            except BaseException:
+                semaphore.release()
+                raise
+            else:
+                if kwargs.get("stream"):
+                    # The request is still running while the caller reads it.
+                    return LimitedStream(result, semaphore.release)
+                semaphore.release()
+                return result
+            # Back off outside the semaphore so other requests can use the slot.
+            with self._lock:
+                self.retries[model] += 1
+            attempt += 1
+            self._sleep(delay)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                model: {
+                    "calls": self.calls[model],
+                    "retries": self.retries[model],
+                    "queued_seconds": round(self.queued_seconds[model], 3),
+                    "limit": self.limits.get(model, self.default),
+                }
+                for model in self.calls
+            }
+
+
+class PooledClient:
+    """The parts of ``openai.OpenAI`` the app uses, routed through a ``ModelLimiter``.
+
+    ``raw`` is the underlying client for anything else.
+    """
+
+    def __init__(self, client, limiter: ModelLimiter):
+        self.raw = client
+        self.limiter = limiter
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=partial(limiter.call, client.chat.completions.create)))
+        self.embeddings = SimpleNamespace(create=partial(limiter.call, client.embeddings.create))
+
+
+def build_http_client(max_connections: int = MAX_CONNECTIONS, max_keepalive: int = MAX_KEEPALIVE,
+                      keepalive_seconds: float = KEEPALIVE_SECONDS, timeout: float = TIMEOUT_SECONDS) -> httpx.Client:
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=keepalive_seconds,
+    )
+    return httpx.Client(limits=limits, http2=HTTP2, timeout=timeout)
+
+
+class OpenAIClientRegistry:
+    """One pooled client per (api key, base URL), all sharing one connection pool."""
+
+    def __init__(self, http_client: httpx.Client = None, limiter: ModelLimiter = None):
+        self._http_client = http_client
+        self.limiter = limiter or ModelLimiter()
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @property
+    def http_client(self) -> httpx.Client:
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = build_http_client()
+            return self._http_client
+
+    def get(self, api_key: str = None, base_url: str = None) -> PooledClient:
+        api_key = api_key or env["OPENAI_API_KEY"]
+        base_url = base_url or env.get("OPENAI_BASE_URL")
+        http_client = self.http_client
+        with self._lock:
+            client = self._clients.get((api_key, base_url))
+            if client is None:
+                # Retries happen in the limiter, with jitter and outside the concurrency slot.
+                raw = openai.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client, max_retries=0)
+                client = self._clients[(api_key, base_url)] = PooledClient(raw, self.limiter)
+            return client
+
+    def close(self):
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            self._clients.clear()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> OpenAIClientRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = OpenAIClientRegistry()
+        return _registry
+
+
+def get_openai_client(api_key: str = None, base_url: str = None) -> PooledClient:
+    return get_client_registry().get(api_key, base_url)
+
+
+def get_http_client() -> httpx.Client:
+    """The shared connection pool, for SDK wrappers that accept an ``http_client`` (e.g. LangChain)."""
+    return get_client_registry().http_client
@@ -0,0 +1,105 @@
+import json
+import time
+from typing import Any
+
+from crewai import BaseLLM
+from pydantic import model_validator
+
+from services.llm_cache import BYPASS, cache_key
+
+
+def split_messages(messages):
+    """``(context, question)``: the last user message, and everything before it.
+
+    The semantic cache tier compares questions only within an identical
+    context, so two questions about the same long document never match on
+    the document alone.
+    """
+    if isinstance(messages, str):
+        return "", messages
+    messages = list(messages)
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].get("role") == "user":
+            content = messages[index].get("content")
+            context = messages[:index] + messages[index + 1:]
+            question = content if isinstance(content, str) else json.dumps(content, sort_keys=True, default=str)
+            return json.dumps(context, sort_keys=True, default=str), question
+    return json.dumps(messages, sort_keys=True, default=str), ""
+
+
+class RoutedLLM(BaseLLM):
+    """CrewAI LLM whose model is picked per call by a ``ModelRouter``.
+
+    Agents get this instance as is (CrewAI passes ``BaseLLM`` subclasses
+    through untouched), so every agent call reaches the router.
+    ``factory(model)`` returns the CrewAI LLM for a model name. With a
+    ``cache`` (an ``LLMResponseCache``), answers are cached under the model
+    that produced them, so fallback answers are never served once the
+    primary is back. Only calls that reach the model are timed and recorded
+    against ``route``; cache hits would make a slow model look fast.
+    """
+
+    llm_type: str = "routed"
+    route: str
+    router: Any
+    factory: Any
+    cache: Any = None
+    bypass: bool = BYPASS
+
+    @model_validator(mode="before")
+    @classmethod
+    def _route_model(cls, data: Any) -> Any:
+        # BaseLLM requires a model name; report the route's primary model.
+        if isinstance(data, dict) and not data.get("model"):
+            data["model"] = data["router"].route(data["route"]).model
+        return data
+
+    def _model(self, model):
+        llm = self.factory(model)
+        stop = list(getattr(self, "stop_sequences", self.stop) or [])
+        if stop and list(llm.stop or []) != stop:
+            # Agents set stop words on the LLM they were given; the shared per-model LLM must not keep them.
+            llm = llm.model_copy(update={"stop": stop})
+        return llm
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None,
+             response_model=None, **kwargs):
+        model = self.router.choose(self.route)
+        llm = self._model(model)
+        # Tool calls and structured output have effects beyond the returned text; always run those.
+        cacheable = self.cache is not None and not tools and not available_functions and response_model is None
+        use_cache = cacheable and not self.bypass
+        if use_cache:
+            context, question = split_messages(messages)
+            key, scope = cache_key(llm, messages, llm.stop)
+            response, _ = self.cache.lookup(key, scope, context, question)
+            if response is not None:
+                return response
+        elif cacheable:
+            self.cache.record_bypass()
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = llm.call(messages, tools=tools, callbacks=callbacks, available_functions=available_functions,
+                                from_task=from_task, from_agent=from_agent, response_model=response_model, **kwargs)
+            ok = True
+        finally:
+            seconds = time.perf_counter() - started
+            self.router.record(self.route, model, seconds, ok)
+        if use_cache and isinstance(response, str):
+            self.cache.put(key, scope, context, question, response, seconds)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        llm = self.factory(self.router.route(self.route).model)
+        return getattr(llm, "supports_function_calling", lambda: False)()
+
+    def supports_stop_words(self) -> bool:
+        return self.factory(self.router.route(self.route).model).supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        # The fallback may have a smaller window than the primary; size prompts for the smaller one.
+        route = self.router.route(self.route)
+        models = [route.model] + ([route.fallback] if route.fallback else [])
+        return min(self.factory(model).get_context_window_size() for model in models)
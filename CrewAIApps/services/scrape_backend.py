@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from os import environ as env
+
+import requests
+from langchain.tools import BaseTool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SCRAPE_POOL_HOSTS = int(env.get("SCRAPE_POOL_HOSTS", 32))
+SCRAPE_PER_HOST = int(env.get("SCRAPE_PER_HOST_CONNECTIONS", 4))
+SCRAPE_FRESH_SECONDS = float(env.get("SCRAPE_FRESH_SECONDS", 300))
+SCRAPE_MAX_PAGES = int(env.get("SCRAPE_CACHE_MAX_PAGES", 1024))
+SCRAPE_MAX_WORKERS = int(env.get("SCRAPE_MAX_WORKERS", 8))
+USER_AGENT = "Mozilla/5.0 (compatible; CrewAIApps/1.0)"
+
+
+# ===== HTML to Text =====
+class _TextExtractor(HTMLParser):
+    SKIP = {"script", "style", "noscript", "template", "svg", "head"}
+    BLOCK = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "table"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skipping += 1
+        elif tag in self.BLOCK:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skipping:
+            self._skipping -= 1
+        elif tag in self.BLOCK:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    lines = (re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(parser.parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+# ===== Backend =====
+class _Page:
+    __slots__ = ("etag", "last_modified", "content_hash", "checked_at")
+
+    def __init__(self, etag, last_modified, content_hash, checked_at):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.checked_at = checked_at
+
+
+class ScrapeBackend:
+    """Pooled, cached page fetcher shared by every scraping agent.
+
+    Pages fetched within ``fresh_seconds`` are served without touching the
+    network; older ones are revalidated with a conditional GET. Extracted
+    text is cached by content hash, so identical bodies are parsed once.
+    """
+
+    def __init__(self, pool_hosts: int = SCRAPE_POOL_HOSTS, per_host: int = SCRAPE_PER_HOST,
+                 fresh_seconds: float = SCRAPE_FRESH_SECONDS, max_pages: int = SCRAPE_MAX_PAGES,
+                 timeout: float = 15):
+        self.fresh_seconds = fresh_seconds
+        self.max_pages = max_pages
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=pool_hosts,
+            pool_maxsize=per_host,
+            pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._pages = OrderedDict()  # url -> _Page
+        self._texts = OrderedDict()  # content hash -> text
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+        self.text_hits = 0
+        self.errors = 0
+
+    def fetch(self, url: str) -> str:
+        with self._lock:
+            self.requests += 1
+            page = self._pages.get(url)
+            if page is not None and page.content_hash in self._texts:
+                self._pages.move_to_end(url)
+                if time.monotonic() - page.checked_at < self.fresh_seconds:
+                    self.fresh_hits += 1
+                    return self._texts[page.content_hash]
+            else:
+                page = None
+
+        headers = {}
+        if page is not None:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+
+        response = self._get(url, headers)
+        if response.status_code == 304:
+            with self._lock:
+                page.checked_at = time.monotonic()
+                self.revalidated += 1
+                text = self._texts.get(page.content_hash)
+            if text is not None:
+                return text
+            # The cached text was evicted while revalidating; a 304 has no body to rebuild it from.
+            response = self._get(url, {})
+
+        body = response.content
+        content_hash = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self.downloads += 1
+            text = self._texts.get(content_hash)
+            if text is not None:
+                self.text_hits += 1
+        if text is None:
+            text = html_to_text(response.text)
+
+        with self._lock:
+            self._texts[content_hash] = text
+            self._texts.move_to_end(content_hash)
+            self._pages[url] = _Page(
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                content_hash,
+                time.monotonic(),
+            )
+            self._pages.move_to_end(url)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            while len(self._texts) > self.max_pages:
+                self._texts.popitem(last=False)
+        return text
+
+    def _get(self, url, headers):
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and not headers:
+                # Only a conditional GET can be answered without a body.
+                raise requests.HTTPError(f"304 Not Modified for an unconditional GET: {url}", response=response)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException:
+            with self._lock:
+                self.errors += 1
+            raise
+        return response
+
+    def fetch_many(self, urls, max_workers: int = SCRAPE_MAX_WORKERS) -> dict:
+        """Fetch many URLs concurrently; failures map to an error message."""
+        urls = list(dict.fromkeys(urls))
+
+        def fetch_one(url):
+            try:
+                return self.fetch(url)
+            except Exception as e:
+                return f"Error fetching {url}: {e}"
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            return dict(zip(urls, executor.map(fetch_one, urls)))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "fresh_hits": self.fresh_hits,
+                "revalidated": self.revalidated,
+                "downloads": self.downloads,
+                "text_hits": self.text_hits,
+                "errors": self.errors,
+                "pages": len(self._pages),
+            }
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_scrape_backend() -> ScrapeBackend:
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = ScrapeBackend()
+        return _backend
+
+
+class ScrapeTool(BaseTool):
+    name: str = "read_website_content"
+    description: str = (
+        "Read the text content of a website. Pass one URL, or several separated by spaces "
+        "or newlines to read them all at once."
+    )
+
+    def _run(self, website_url: str) -> str:
+        urls = website_url.split()
+        backend = get_scrape_backend()
+        if len(urls) == 1:
+            return backend.fetch(urls[0])
+        pages = backend.fetch_many(urls)
+        return "\n\n".join(f"===== {url} =====\n{text}" for url, text in pages.items())
+
+    async def _arun(self, website_url: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run, website_url)
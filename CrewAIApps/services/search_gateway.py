@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from os import environ as env
+
+import requests
+from langchain.tools import BaseTool
+
+from services.stats import percentile
+
+SERPER_BASE_URL = env.get("SERPER_BASE_URL", "https://google.serper.dev")
+SEARCH_TTL = float(env.get("SEARCH_CACHE_TTL_SECONDS", 3600))
+SEARCH_RATE = float(env.get("SEARCH_RATE_PER_SECOND", 5))
+SEARCH_BURST = int(env.get("SEARCH_BURST", 10))
+SEARCH_MAX_ENTRIES = int(env.get("SEARCH_CACHE_MAX_ENTRIES", 2048))
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class SearchGateway:
+    """Serper client shared by every crew.
+
+    Identical queries are answered from a TTL cache, concurrent identical
+    queries share one in-flight request, and network calls pass a global
+    token bucket.
+    """
+
+    def __init__(self, api_key: str, base_url: str = SERPER_BASE_URL, ttl: float = SEARCH_TTL,
+                 rate: float = SEARCH_RATE, burst: int = SEARCH_BURST, max_entries: int = SEARCH_MAX_ENTRIES,
+                 timeout: float = 15):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.session = requests.Session()
+        self._cache = OrderedDict()  # key -> (expires_at, response)
+        self._inflight = {}  # key -> Future
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.hits = 0
+        self.coalesced = 0
+        self.network_calls = 0
+        self.errors = 0
+        self.rate_limited_seconds = 0.0
+        self._latencies = []
+
+    @staticmethod
+    def key(query: str, search_type: str = "search", n_results: int = 10):
+        return search_type, " ".join(query.lower().split()), n_results
+
+    def search(self, query: str, search_type: str = "search", n_results: int = 10) -> dict:
+        key = self.key(query, search_type, n_results)
+        with self._lock:
+            self.requests += 1
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._fetch(query, search_type, n_results)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(response)
+        return response
+
+    def _fetch(self, query, search_type, n_results):
+        waited = self.bucket.acquire()
+        started = time.perf_counter()
+        response = self.session.post(
+            f"{self.base_url}/{search_type}",
+            json={"q": query, "num": n_results},
+            headers={"X-API-KEY": self.api_key, "Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.network_calls += 1
+            self.rate_limited_seconds += waited
+            self._latencies.append(elapsed)
+            del self._latencies[:-1000]
+        return response.json()
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = list(self._latencies)
+            served_locally = self.hits + self.coalesced
+            return {
+                "requests": self.requests,
+                "hits": self.hits,
+                "coalesced": self.coalesced,
+                "network_calls": self.network_calls,
+                "errors": self.errors,
+                "hit_rate": served_locally / self.requests if self.requests else 0.0,
+                "latency_p50_ms": percentile(latencies, 0.5) * 1000,
+                "latency_p95_ms": percentile(latencies, 0.95) * 1000,
+                "rate_limited_seconds": self.rate_limited_seconds,
+            }
+
+
+def format_results(response: dict, n_results: int = 10) -> str:
+    lines = []
+    for item in response.get("organic", [])[:n_results]:
+        lines.append("\n".join([
+            f"Title: {item.get('title', '')}",
+            f"Link: {item.get('link', '')}",
+            f"Snippet: {item.get('snippet', '')}",
+            "---",
+        ]))
+    return "\n".join(lines) or "No results found."
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_search_gateway() -> SearchGateway:
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = SearchGateway(api_key=env["SERPER_API_KEY"])
+        return _gateway
+
+
+class SearchTool(BaseTool):
+    name: str = "search_internet"
+    description: str = "Search the internet for a query and return the top results with titles, links and snippets."
+
+    def _run(self, search_query: str) -> str:
+        return format_results(get_search_gateway().search(search_query))
+
+    async def _arun(self, search_query: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run, search_query)
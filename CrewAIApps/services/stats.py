@@ -0,0 +1,6 @@
+def percentile(samples, p: float) -> float:
+    """Nearest-rank percentile of ``samples`` (any order), ``p`` in [0, 1]; 0.0 when empty."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
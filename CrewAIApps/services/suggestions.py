@@ -0,0 +1,164 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from os import environ as env
+
+CONTEXT_CHARS = 4000
+SUGGESTION_TTL = float(env.get("SUGGESTION_TTL_SECONDS", 6 * 3600))
+SUGGESTION_MAX_ENTRIES = int(env.get("SUGGESTION_MAX_ENTRIES", 512))
+# After a failed generation, non-blocking readers wait this long before starting another.
+SUGGESTION_RETRY_SECONDS = float(env.get("SUGGESTION_RETRY_SECONDS", 60))
+
+DOCUMENT_PROMPT = """
+Based on the following document content, generate {num_questions} useful and diverse questions a user might ask:
+
+---
+{context}
+---
+Format as a numbered list.
+"""
+
+TRADING_PROMPT = """
+Based on the user's trading preferences, generate {num_questions} useful questions they might ask:
+
+---
+{context}
+---
+Format as a numbered list.
+"""
+
+
+def generate_sample_questions(client, prompt_template, context, num_questions=5, model=None):
+    """Suggested questions; the model comes from the "suggestions" route unless ``model`` is given."""
+    if client is None:
+        from services.openai_clients import get_openai_client
+
+        client = get_openai_client()
+    prompt = prompt_template.format(num_questions=num_questions, context=context[:CONTEXT_CHARS])
+    request = dict(messages=[{"role": "user", "content": prompt}], temperature=0.7, max_tokens=300)
+    if model is None:
+        from services.model_router import get_model_router
+
+        response = get_model_router().call("suggestions", client.chat.completions.create, **request)
+    else:
+        response = client.chat.completions.create(model=model, **request)
+    reply = response.choices[0].message.content
+    # Parse and return question list
+    return [line.strip("0123456789. ") for line in reply.split("\n") if line.strip()]
+
+
+class SuggestionCache:
+    """TTL + LRU cache of suggested questions keyed on a hash of their context.
+
+    ``prefetch`` starts generation in the background (at most once per key at a
+    time), so the first render after an upload finds it already under way.
+    ``get_or_prefetch`` never blocks, for pages that poll until it is ready.
+    ``hits`` counts lookups served from the cache, ``misses`` the generations
+    they had to start.
+    """
+
+    def __init__(self, ttl: float = SUGGESTION_TTL, max_entries: int = SUGGESTION_MAX_ENTRIES, max_workers: int = 4):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, questions)
+        self._inflight = {}  # key -> Future
+        self._failed = {}  # key -> monotonic time of the last failed generation
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="suggestions")
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+
+    @staticmethod
+    def key(kind: str, context: str) -> str:
+        return hashlib.sha256(f"{kind}\0{context[:CONTEXT_CHARS]}".encode()).hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, questions = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return questions
+
+    def put(self, key: str, questions):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, questions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def prefetch(self, kind: str, context: str, generate):
+        """Start ``generate(context)`` in the background unless cached, running or recently failed."""
+        key = self.key(kind, context)
+        if self.get(key) is not None:
+            return None
+        with self._lock:
+            if key in self._entries:
+                return None
+            failed_at = self._failed.get(key)
+            if failed_at is not None and time.monotonic() - failed_at < SUGGESTION_RETRY_SECONDS:
+                return None
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(self._generate, key, context, generate)
+                self._inflight[key] = future
+                self.misses += 1
+            return future
+
+    def get_or_prefetch(self, kind: str, context: str, generate):
+        """Cached questions, or None while they are generated in the background."""
+        key = self.key(kind, context)
+        questions = self.get(key)
+        if questions is not None:
+            with self._lock:
+                self.hits += 1
+            return questions
+        self.prefetch(kind, context, generate)
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "inflight": len(self._inflight),
+                "hits": self.hits,
+                "misses": self.misses,
+                "generated": self.generated,
+            }
+
+    def _generate(self, key, context, generate):
+        try:
+            questions = generate(context)
+        except Exception as e:
+            print(f"Suggested question generation failed: {e}")
+            with self._lock:
+                self._failed[key] = time.monotonic()
+            raise
+        else:
+            self.put(key, questions)
+            with self._lock:
+                self.generated += 1
+                self._failed.pop(key, None)
+            return questions
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_suggestion_cache() -> SuggestionCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SuggestionCache()
+        return _cache
@@ -1,21 +1,26 @@
 def render_tab1():
+    import io
     import streamlit as st
     import pandas as pd
-    from PyPDF2 import PdfReader
-    from pptx import Presentation
     from crewai import Agent, Task, Crew, Process, LLM
-    from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
     from config import api_key  # Ensure this is securely loaded
     from os import environ as env
-    from config import llm
+    from config import llm_cache, llm_for, model_router
+    from chatbot.extraction_cache import content_key, get_extraction_cache
+    from chatbot.pipeline import iter_file_chunks, kind_for_mime
+    from chatbot.streaming import StreamMetrics, stream_answer, streaming_stats
+    from chatbot.vector_index import format_passages, get_embedder, get_index_store
+    from services.suggestions import DOCUMENT_PROMPT, generate_sample_questions, get_suggestion_cache
+    from services.crew_registry import get_crew_registry
 
     from dotenv import load_dotenv
     load_dotenv()
 
-    from openai import OpenAI
+    from services.openai_clients import get_openai_client
 
     api_key = env["OPENAI_API_KEY"]
-    client = OpenAI(api_key=api_key)
+    # Shared across reruns and tabs, so connections and TLS sessions are reused.
+    client = get_openai_client(api_key)
 
     # ===== Streamlit Setup =====
     # Initialize session state
@@ -25,6 +30,9 @@ def render_tab1():
     if 'file_content' not in st.session_state:
         st.session_state.file_content = None
 
+    if 'doc_hashes' not in st.session_state:
+        st.session_state.doc_hashes = []
+
 
     # ===== Display Chat History =====
     def display_chat_history():
@@ -34,52 +42,59 @@ def render_tab1():
 
 
     # ===== File Extraction Utils =====
-    def extract_pdf(file):
-        try:
-            reader = PdfReader(file)
-            return "\n".join(page.extract_text() or "" for page in reader.pages)
-        except Exception as e:
-            st.error(f"PDF Extraction Error: {e}")
-            return "Unable to extract PDF text."
-
-
-    def extract_ppt(file):
-        try:
-            prs = Presentation(file)
-            text = ""
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text += shape.text + "\n"
-            return text
-        except Exception as e:
-            st.error(f"PPT Extraction Error: {e}")
-            return "Unable to extract PPT text."
-
+    # Extraction is keyed on the file's bytes, so a given upload is parsed
+    # once and then replayed from the cache on every rerun and session.
+    extraction_cache = get_extraction_cache()
+    PREVIEW_CHARS = 4000
+
+    # Suggestions are generated once per document, in the background right after upload.
+    suggestion_cache = get_suggestion_cache()
+    SUGGESTION_POLL_SECONDS = 1.5
+
+    def suggest_questions(context):
+        return generate_sample_questions(client, DOCUMENT_PROMPT, context)
+
+    crew_registry = get_crew_registry()
+    index_store = get_index_store()
+    embedder = get_embedder(client)
+    TOP_K = 6
+
+    def extract_and_index(file):
+        """Extract a file's chunks and make sure its vector index exists.
+
+        Chunks stream straight into the index build on first sight; once the
+        index exists they are only replayed until the preview is full. Returns
+        the index plus the file's first chunk and a text preview, never the
+        whole file.
+        """
+        kind = kind_for_mime(file.type)
+        if kind is None:
+            st.warning(f"Unsupported file type: {file.name}")
+            return None, None, None, ""
+        data = file.getvalue()
+        doc_hash = content_key(kind, data)
+        seen = {"first": None, "preview": ""}
+
+        def observe(stream):
+            for chunk in stream:
+                if seen["first"] is None:
+                    seen["first"] = chunk
+                if len(seen["preview"]) < PREVIEW_CHARS:
+                    seen["preview"] += chunk.text + "\n"
+                yield chunk
 
-    def extract_csv(file):
         try:
-            df = pd.read_csv(file)
-            st.write(df)
-            return df.to_csv(index=False)
+            chunks = observe(iter_file_chunks(file.name, kind, data, extraction_cache))
+            index = index_store.get_or_build(doc_hash, chunks, embedder)
+            # Already indexed: the build consumed nothing, so replay just enough for the preview.
+            for _ in chunks:
+                if len(seen["preview"]) >= PREVIEW_CHARS:
+                    break
+            chunks.close()
         except Exception as e:
-            st.error(f"CSV Extraction Error: {e}")
-            return "Unable to extract CSV file."
-
-
-    def process_uploaded_file(file):
-        file_type = file.type
-        if file_type == "application/pdf":
-            return extract_pdf(file)
-        elif file_type in [
-            "application/vnd.ms-powerpoint",
-            "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-        ]:
-            return extract_ppt(file)
-        elif file_type == "text/csv":
-            return extract_csv(file)
-        else:
-            return "Unsupported file type."
+            st.error(f"{kind.upper()} Extraction Error ({file.name}): {e}")
+            return None, None, None, ""
+        return doc_hash, index, seen["first"], seen["preview"]
 
 
     # ===== Main App Interface =====
@@ -91,26 +106,36 @@ def render_tab1():
         accept_multiple_files=True
     )
 
-    pdf_ppt_content = ""
-    csv_content = ""
-
-    for file in uploaded_files:
-        if file.type == "application/pdf":
-            pdf_ppt_content += extract_pdf(file)
-        elif file.type in [
-            "application/vnd.ms-powerpoint",
-            "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-        ]:
-            pdf_ppt_content += extract_ppt(file)
-        elif file.type == "text/csv":
-            csv_content += extract_csv(file)
-
-
     if uploaded_files:
-        combined_content = pdf_ppt_content + csv_content
-        st.session_state.file_content = combined_content
+        passage_count = 0
+        preview = ""
+        doc_hashes = []
+        for file in uploaded_files:
+            # Only the index and a bounded preview outlive this loop; the session keeps neither chunks nor full text.
+            doc_hash, index, first_chunk, file_preview = extract_and_index(file)
+            if doc_hash is None:
+                continue
+            if first_chunk is not None and first_chunk.kind == "csv":
+                st.caption(f"Preview of {file.name}, {first_chunk.locator}")
+                st.write(pd.read_csv(io.StringIO(first_chunk.text)))
+            doc_hashes.append(doc_hash)
+            passage_count += len(index.passages)
+            if len(preview) < PREVIEW_CHARS:
+                preview += file_preview
+
+        preview = preview[:PREVIEW_CHARS]
+        st.session_state.doc_hashes = doc_hashes
+        st.session_state.file_content = preview
+        suggestion_cache.prefetch("document", preview, suggest_questions)
         st.subheader("📚 Combined Extracted Content")
-        st.text_area("Combined Content", combined_content, height=300)
+        st.text_area("Combined Content (preview)", preview, height=300)
+
+        cache_stats = extraction_cache.stats()
+        st.caption(
+            f"{passage_count} passages indexed from {len(uploaded_files)} files. "
+            f"Extraction cache: {cache_stats['hits']} hits, {cache_stats['disk_hits']} disk hits, "
+            f"{cache_stats['misses']} misses, {cache_stats['evictions']} evictions"
+        )
 
     # Guard clause if no content
     if not st.session_state.file_content:
@@ -118,105 +143,140 @@ def render_tab1():
         st.stop()
 
 
-    # ===== Knowledge & LLM Setup =====
-    if st.session_state.file_content:
-        pdf_ppt_source = StringKnowledgeSource(content=pdf_ppt_content)
-        csv_source = StringKnowledgeSource(content=csv_content)
-
-        my_source = StringKnowledgeSource(
-            content=my_text,
-            embedding_model="cohere-embed-v3",
-            vector_store="chroma"
-        )
-
+    # ===== Retrieval =====
+    # Only the passages relevant to the question are sent to the agents.
+    def retrieve_context(query_vector, kinds):
+        results = index_store.search(st.session_state.doc_hashes, query_vector, embedder, k=TOP_K, kinds=kinds)
+        return format_passages(results) or "No relevant content found."
 
-    def generate_sample_questions(context, num_questions=5):
-        prompt = f"""
-        Based on the following document content, generate {num_questions} useful and diverse questions a user might ask:
-
-        ---
-        {context[:4000]}
-        ---
-        Format as a numbered list.
-        """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # or "gpt-3.5-turbo", gpt-4 if you prefer
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=300,
+    # ===== Crew Template =====
+    # Built once per process by the registry; each question gets a cheap copy.
+    def build_docs_crew():
+        pdf_ppt_agent = Agent(
+            role="Document Analyst",
+            goal="Answer questions from PDFs and PPTs",
+            backstory="Expert in analyzing and summarizing documents",
+            llm=llm_for("docs.document_analyst"),
+            verbose=True,
         )
 
-        reply = response.choices[0].message.content
-        # Parse and return question list
-        return [line.strip("0123456789. ") for line in reply.split("\n") if line.strip()]
-
-
-    pdf_ppt_agent = Agent(
-        role="Document Analyst",
-        goal="Answer questions from PDFs and PPTs",
-        backstory="Expert in analyzing and summarizing documents",
-        llm=llm,
-        verbose=True,
-    )
-
-    csv_agent = Agent(
-        role="Data Analyst",
-        goal="Answer questions from CSV data",
-        backstory="Skilled at reading and interpreting structured data tables",
-        llm=llm,
-        verbose=True,
-    )
+        csv_agent = Agent(
+            role="Data Analyst",
+            goal="Answer questions from CSV data",
+            backstory="Skilled at reading and interpreting structured data tables",
+            llm=llm_for("docs.csv_analyst"),
+            verbose=True,
+        )
 
-    task_for_doc = Task(
-        description="Answer user's question using information from PDFs and PPTs",
-        expected_output="Insightful summary or answer from documents",
-        agent=pdf_ppt_agent
-    )
+        task_for_doc = Task(
+            description=(
+                "Answer user's question using information from PDFs and PPTs.\n\n"
+                "Question: {question}\n\nRelevant document excerpts:\n{document_context}"
+            ),
+            expected_output="Insightful summary or answer from documents",
+            agent=pdf_ppt_agent
+        )
 
-    task_for_csv = Task(
-        description="Answer user's question using the CSV data",
-        expected_output="Answer based on data analysis or trends",
-        agent=csv_agent
-    )
+        task_for_csv = Task(
+            description=(
+                "Answer user's question using the CSV data.\n\n"
+                "Question: {question}\n\nRelevant CSV rows:\n{csv_context}"
+            ),
+            expected_output="Answer based on data analysis or trends",
+            agent=csv_agent
+        )
 
-    # Create the crew
-    crew = Crew(
-        agents=[pdf_ppt_agent, csv_agent],
-        tasks=[task_for_doc, task_for_csv],
-        knowledge_sources=[pdf_ppt_source, csv_source],
-        process=Process.sequential,
-        manager_llm=llm,
-        verbose=True
-    )
+        # Create the crew
+        return Crew(
+            agents=[pdf_ppt_agent, csv_agent],
+            tasks=[task_for_doc, task_for_csv],
+            process=Process.sequential,
+            manager_llm=llm_for("docs.manager"),
+            verbose=True
+        )
 
     # ===== Chat UI =====
     st.divider()
     st.subheader("💬 Ask a Question")
 
-    # Show suggestions based on context
+    # Show suggestions based on context. The prefetch started at upload keeps
+    # running while the rest of the page renders; this fragment polls for it
+    # until it lands instead of blocking the script.
     if st.session_state.file_content:
         st.markdown("💡 Suggested Questions:")
-        sample_questions = generate_sample_questions(st.session_state.file_content)
-        for q in sample_questions:
-            st.markdown(f"- {q}")
+        context = st.session_state.file_content
+        pending = suggestion_cache.get(suggestion_cache.key("document", context)) is None
+
+        @st.fragment(run_every=SUGGESTION_POLL_SECONDS if pending else None)
+        def show_suggestions():
+            sample_questions = suggestion_cache.get_or_prefetch("document", context, suggest_questions)
+            if sample_questions is None:
+                st.caption("⏳ Generating suggested questions...")
+                return
+            for q in sample_questions:
+                st.markdown(f"- {q}")
+
+        show_suggestions()
 
     display_chat_history()
     user_query = st.text_input("Enter your question", key="docs_chatbot_input")
 
-    if st.button("Send") and user_query.strip():
-        with st.spinner("Thinking..."):
-            results = crew.kickoff(inputs={"question": user_query})
+    stream_answers = st.toggle(
+        "Stream answer", value=False,
+        help="Show the answer as it is generated: one streamed model call instead of the two-agent crew, "
+             "without the crew's per-agent models or the LLM response cache.",
+    )
 
+    if st.button("Send") and user_query.strip():
+        # One embedding call per question, shared by both retrievals.
+        query_vector = embedder.embed([user_query])[0]
+        document_context = retrieve_context(query_vector, {"pdf", "ppt"})
+        csv_context = retrieve_context(query_vector, {"csv"})
+
+        if stream_answers:
+            # Tokens render as they arrive, so the wait is time-to-first-token, not the whole answer.
+            st.markdown(f"**User:** {user_query}")
+            metrics = StreamMetrics()
+            stream_model = model_router.choose("docs.stream")
+            results = st.write_stream(
+                stream_answer(client, user_query, document_context, csv_context, metrics, model=stream_model)
+            )
+            model_router.record("docs.stream", stream_model, metrics.total_seconds)
             st.session_state.chat_history.append(("User", user_query))
             st.session_state.chat_history.append(("AI", results))
-
-            st.success("Response received!")
-            display_chat_history()
-
-            feedback = st.radio("Was the answer helpful?", ["Yes", "No"], horizontal=True)
-            if feedback:
-                st.write(f"Thanks for your feedback: {feedback}")
-
-            for file in uploaded_files:
-                st.download_button(f"Download {file.name}", data=file, file_name=file.name)
+            st.caption(
+                f"First token after {metrics.first_token_seconds or 0:.2f}s; "
+                f"{metrics.tokens} tokens at {metrics.tokens_per_second:.1f} tokens/s from {stream_model}"
+            )
+            stream_stats = streaming_stats.stats()
+            st.caption(
+                f"Across {stream_stats['answers']} streamed answers: first token p50 {stream_stats['ttft_p50_seconds']:.2f}s, "
+                f"p95 {stream_stats['ttft_p95_seconds']:.2f}s; {stream_stats['avg_tokens_per_second']:.1f} tokens/s on average"
+            )
+        else:
+            with st.spinner("Thinking..."):
+                crew = crew_registry.get("docs_chatbot", build_docs_crew)
+                results = crew.kickoff(inputs={
+                    "question": user_query,
+                    "document_context": document_context,
+                    "csv_context": csv_context,
+                })
+
+                st.session_state.chat_history.append(("User", user_query))
+                st.session_state.chat_history.append(("AI", results))
+
+                st.success("Response received!")
+                llm_stats = llm_cache.stats()
+                st.caption(
+                    f"LLM cache: {llm_stats['exact_hits']} exact hits, {llm_stats['semantic_hits']} semantic hits, "
+                    f"{llm_stats['misses']} misses, {llm_stats['saved_seconds']:.1f}s saved"
+                )
+                display_chat_history()
+
+        feedback = st.radio("Was the answer helpful?", ["Yes", "No"], horizontal=True)
+        if feedback:
+            st.write(f"Thanks for your feedback: {feedback}")
+
+        for file in uploaded_files:
+            st.download_button(f"Download {file.name}", data=file, file_name=file.name)
@@ -1,12 +1,18 @@
 def render_tab2():
+    import time
     import streamlit as st
     from dotenv import load_dotenv
     from os import environ as env
     from crewai import Crew, Agent, Task, Process, LLM
-    from crewai_tools import ScrapeWebsiteTool, SerperDevTool
-    from openai import OpenAI
+    from services.openai_clients import get_openai_client
     from langchain.chat_models import ChatOpenAI
-    from config import llm
+    from config import llm_for
+    from services.suggestions import TRADING_PROMPT, generate_sample_questions, get_suggestion_cache
+    from services.crew_registry import get_crew_registry
+    from services.search_gateway import SearchTool, get_search_gateway
+    from services.scrape_backend import ScrapeTool, get_scrape_backend
+    from financial.jobs import get_job_manager
+    from financial.result_store import get_result_store
 
     # ===== Environment & API Setup =====
     load_dotenv()
@@ -28,121 +34,209 @@ def render_tab2():
         st.stop()
 
     # ===== OpenAI Setup =====
-    client = OpenAI(api_key=api_key)
-
-    # ===== CrewAI Tools =====
-    search_tool = SerperDevTool()
-    scrape_tool = ScrapeWebsiteTool()
-
-    # ===== Agents =====
-    data_analyst_agent = Agent(
-        role="Data Analyst",
-        goal="Analyze real-time market data to identify trends.",
-        backstory="A market analyst using ML/statistical models.",
-        tools=[search_tool, scrape_tool],
-        allow_delegation=True,
-        verbose=True,
-    )
+    client = get_openai_client(api_key)
 
-    trading_strategy_agent = Agent(
-        role="Strategy Developer",
-        goal="Develop trading strategies based on market insights.",
-        backstory="Designs and tests strategies from market signals.",
-        tools=[search_tool, scrape_tool],
-        allow_delegation=True,
-        verbose=True,
-    )
+    # ===== Suggested Questions (prefetched while the crew runs) =====
+    suggestion_cache = get_suggestion_cache()
+    sample_input_summary = f"Stock: {stock_selection}, Strategy: {trading_strategy_preference}, Risk: {risk_tolerance}"
 
-    execution_agent = Agent(
-        role="Trade Advisor",
-        goal="Plan optimal trade execution.",
-        backstory="Optimizes timing and logistics of trades.",
-        tools=[search_tool, scrape_tool],
-        allow_delegation=True,
-        verbose=True,
-    )
+    def suggest_questions(context):
+        return generate_sample_questions(client, TRADING_PROMPT, context)
 
-    risk_management_agent = Agent(
-        role="Risk Advisor",
-        goal="Assess risks of trading plans.",
-        backstory="Evaluates risk exposure and mitigation.",
-        tools=[search_tool, scrape_tool],
-        allow_delegation=True,
-        verbose=True,
-    )
+    suggestion_cache.prefetch("trading", sample_input_summary, suggest_questions)
 
-    # ===== Tasks =====
-    data_analysis_task = Task(
-        description=f"Analyze market data for {stock_selection}.",
-        expected_output="Market insights and trends.",
-        agent=data_analyst_agent,
-    )
-    strategy_development_task = Task(
-        description=f"Create strategies for {stock_selection} considering {risk_tolerance} tolerance and {trading_strategy_preference}.",
-        expected_output="List of trading strategies.",
-        agent=trading_strategy_agent,
-    )
-    execution_planning_task = Task(
-        description=f"Plan trade execution for {stock_selection} based on strategies and market conditions.",
-        expected_output="Execution timing and pricing plan.",
-        agent=execution_agent,
-    )
-    risk_assessment_task = Task(
-        description=f"Assess risks for trading {stock_selection}.",
-        expected_output="Risk analysis and mitigation strategies.",
-        agent=risk_management_agent,
-    )
+    crew_registry = get_crew_registry()
+    job_manager = get_job_manager()
+    result_store = get_result_store()
+    POLL_SECONDS = 1.5
+    TASK_COUNT = 4
 
-    # ===== Create the Crew =====
-    financial_trading_crew = Crew(
-        agents=[
-            data_analyst_agent,
-            trading_strategy_agent,
-            execution_agent,
-            risk_management_agent,
-        ],
-        tasks=[
-            data_analysis_task,
-            strategy_development_task,
-            execution_planning_task,
-            risk_assessment_task,
-        ],
-        verbose=True,
-        process=Process.hierarchical,
-        manager_llm=llm,
-    )
+    # ===== Crew Template =====
+    # Built once per process by the registry: the trading profile only reaches
+    # the tasks through kickoff inputs, so every request gets a cheap copy.
+    def build_financial_crew():
+        # ===== CrewAI Tools =====
+        search_tool = SearchTool()  # shared, cached and rate-limited Serper gateway
+        scrape_tool = ScrapeTool()  # pooled, cached page fetcher
+
+        # ===== Agents =====
+        data_analyst_agent = Agent(
+            role="Data Analyst",
+            goal="Analyze real-time market data to identify trends.",
+            llm=llm_for("financial.data_analyst"),
+            backstory="A market analyst using ML/statistical models.",
+            tools=[search_tool, scrape_tool],
+            allow_delegation=True,
+            verbose=True,
+        )
+
+        trading_strategy_agent = Agent(
+            role="Strategy Developer",
+            goal="Develop trading strategies based on market insights.",
+            llm=llm_for("financial.strategy"),
+            backstory="Designs and tests strategies from market signals.",
+            tools=[search_tool, scrape_tool],
+            allow_delegation=True,
+            verbose=True,
+        )
+
+        execution_agent = Agent(
+            role="Trade Advisor",
+            goal="Plan optimal trade execution.",
+            llm=llm_for("financial.trade"),
+            backstory="Optimizes timing and logistics of trades.",
+            tools=[search_tool, scrape_tool],
+            allow_delegation=True,
+            verbose=True,
+        )
+
+        risk_management_agent = Agent(
+            role="Risk Advisor",
+            goal="Assess risks of trading plans.",
+            llm=llm_for("financial.risk"),
+            backstory="Evaluates risk exposure and mitigation.",
+            tools=[search_tool, scrape_tool],
+            allow_delegation=True,
+            verbose=True,
+        )
+
+        # ===== Tasks =====
+        data_analysis_task = Task(
+            name="Market Analysis",
+            description="Analyze market data for {stock_selection}.",
+            expected_output="Market insights and trends.",
+            agent=data_analyst_agent,
+        )
+        strategy_development_task = Task(
+            name="Trading Strategies",
+            description="Create strategies for {stock_selection} considering {risk_tolerance} tolerance and {trading_strategy_preference}.",
+            expected_output="List of trading strategies.",
+            agent=trading_strategy_agent,
+        )
+        execution_planning_task = Task(
+            name="Execution Plan",
+            description="Plan trade execution for {stock_selection} based on strategies and market conditions.",
+            expected_output="Execution timing and pricing plan.",
+            agent=execution_agent,
+        )
+        risk_assessment_task = Task(
+            name="Risk Assessment",
+            description="Assess risks for trading {stock_selection}.",
+            expected_output="Risk analysis and mitigation strategies.",
+            agent=risk_management_agent,
+        )
+
+        # ===== Create the Crew =====
+        return Crew(
+            agents=[
+                data_analyst_agent,
+                trading_strategy_agent,
+                execution_agent,
+                risk_management_agent,
+            ],
+            tasks=[
+                data_analysis_task,
+                strategy_development_task,
+                execution_planning_task,
+                risk_assessment_task,
+            ],
+            verbose=True,
+            process=Process.hierarchical,
+            manager_llm=llm_for("financial.manager"),
+        )
+
+    # ===== Follow-up Crew Template =====
+    # Questions are answered from the cached analysis by one agent rather than
+    # re-running all four.
+    def build_followup_crew():
+        market_qa_agent = Agent(
+            role="Market Q&A Advisor",
+            goal="Answer follow-up questions using an existing market analysis.",
+            llm=llm_for("financial.followup"),
+            backstory="Explains trading analyses clearly and concisely.",
+            allow_delegation=False,
+            verbose=True,
+        )
+
+        followup_task = Task(
+            description=(
+                "Answer the user's question about {stock_selection} "
+                "({trading_strategy_preference}, {risk_tolerance} risk, capital ${initial_capital}) "
+                "using the analysis below.\n\nQuestion: {question}\n\nAnalysis:\n{analysis}"
+            ),
+            expected_output="A concise answer grounded in the analysis.",
+            agent=market_qa_agent,
+        )
 
-    # ===== Run the Crew =====
-    with st.spinner("Thinking..."):
-        financial_trading_inputs = {
-            "stock_selection": stock_selection,
-            "initial_capital": initial_capital,
-            "risk_tolerance": risk_tolerance,
-            "trading_strategy_preference": trading_strategy_preference,
-            "news_impact_consideration": consider_news,
-        }
-
-        def generate_sample_questions(context, num_questions=5):
-            prompt = f"""
-            Based on the user's trading preferences, generate {num_questions} useful questions they might ask:
-
-            ---
-            {context}
-            ---
-            Format as a numbered list.
-            """
-            response = client.chat.completions.create(
-                model="gpt-4o-mini", # gpt-4o-mini, gpt-4
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=300,
-            )
-            reply = response.choices[0].message.content
-            return [line.strip("0123456789. ") for line in reply.split("\n") if line.strip()]
-
-        result_financial_trading = financial_trading_crew.kickoff(inputs=financial_trading_inputs)
-        st.subheader("📈 Trading Result:")
-        st.markdown(result_financial_trading)
+        return Crew(
+            agents=[market_qa_agent],
+            tasks=[followup_task],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def analysis_text(job):
+        sections = [f"## {label}\n{output}" for label, output in job.snapshot()]
+        sections.append(f"## Summary\n{job.result}")
+        return "\n\n".join(sections)
+
+    # ===== Run the Crew (in the background) =====
+    # The kickoff runs on a worker; this script only polls the job handle and
+    # renders each task's output as soon as it completes.
+    financial_trading_inputs = {
+        "stock_selection": stock_selection,
+        "initial_capital": initial_capital,
+        "risk_tolerance": risk_tolerance,
+        "trading_strategy_preference": trading_strategy_preference,
+        "news_impact_consideration": consider_news,
+    }
+
+    # Each distinct profile is analysed once per freshness window and shared
+    # by every rerun and session asking for it.
+    def submit_analysis():
+        financial_trading_crew = crew_registry.get("financial_trading", build_financial_crew)
+        return job_manager.submit(financial_trading_crew, financial_trading_inputs)
+
+    job = result_store.get_or_submit(financial_trading_inputs, submit_analysis)
+
+    # A changed profile supersedes this session's previous analysis; drop it if it has not started yet.
+    previous_job_id = st.session_state.get("financial_job_id")
+    if previous_job_id not in (None, job.id):
+        job_manager.cancel(previous_job_id)
+    st.session_state.financial_job_id = job.id
+
+    st.subheader("📈 Trading Result:")
+    analysis_pending = not job.done
+
+    # Only this fragment reruns while the crew works; once the job finishes,
+    # one full rerun renders the summary and the chat below it.
+    @st.fragment(run_every=POLL_SECONDS if analysis_pending else None)
+    def show_analysis():
+        task_outputs = job.snapshot()
+        for label, output in task_outputs:
+            with st.expander(f"✅ {label}", expanded=not job.done):
+                st.markdown(output)
+        if analysis_pending and job.done:
+            st.rerun()
+        if job.status == "failed":
+            st.error(f"❌ Error running financial crew: {job.error}")
+        elif not job.done:
+            st.info(f"⏳ Thinking... {len(task_outputs)} of {TASK_COUNT} tasks complete.")
+
+    show_analysis()
+    if analysis_pending or job.status != "done":
+        st.stop()
+
+    st.markdown(job.result)
+    st.caption(f"Analysis from {time.strftime('%H:%M:%S', time.localtime(job.finished_at))}; reused for this profile for {int(result_store.freshness // 60)} minutes.")
+    search_stats = get_search_gateway().stats()
+    scrape_stats = get_scrape_backend().stats()
+    st.caption(
+        f"Search: {search_stats['hits']} cache hits, {search_stats['coalesced']} coalesced, "
+        f"{search_stats['network_calls']} API calls (p95 {search_stats['latency_p95_ms']:.0f} ms). "
+        f"Pages: {scrape_stats['fresh_hits']} fresh hits, {scrape_stats['revalidated']} revalidated, "
+        f"{scrape_stats['downloads']} downloads, {scrape_stats['errors']} errors"
+    )
 
     # ===== Chat UI =====
     st.divider()
@@ -157,26 +251,59 @@ def render_tab2():
             st.markdown(f"{label} {message}")
 
     # ===== Suggested Questions =====
-    sample_input_summary = f"Stock: {stock_selection}, Strategy: {trading_strategy_preference}, Risk: {risk_tolerance}"
-    suggested = generate_sample_questions(sample_input_summary)
+    # Prefetched when the page started; poll for them instead of blocking the chat.
     st.markdown("💡 Suggested Questions:")
-    for q in suggested:
-        st.markdown(f"- {q}")
+    suggestions_pending = suggestion_cache.get(suggestion_cache.key("trading", sample_input_summary)) is None
+
+    @st.fragment(run_every=POLL_SECONDS if suggestions_pending else None)
+    def show_suggestions():
+        suggested = suggestion_cache.get_or_prefetch("trading", sample_input_summary, suggest_questions)
+        if suggested is None:
+            st.caption("⏳ Generating suggested questions...")
+            return
+        for q in suggested:
+            st.markdown(f"- {q}")
+
+    show_suggestions()
 
     display_chat_history()
     user_query = st.text_input("Enter your question", key="financial_analysis")
 
     if st.button("Send") and user_query.strip():
-        with st.spinner("Thinking..."):
-            full_inputs = financial_trading_inputs.copy()
-            full_inputs["question"] = user_query
+        full_inputs = financial_trading_inputs.copy()
+        full_inputs["question"] = user_query
+        full_inputs["analysis"] = analysis_text(job)
+
+        followup_crew = crew_registry.get("financial_followup", build_followup_crew)
+        question_job = job_manager.submit_followup(followup_crew, full_inputs)
+        st.session_state.financial_question_job = (question_job.id, user_query)
+
+    pending = st.session_state.get("financial_question_job")
+    if pending:
+        question_job_id, question = pending
+        question_job = job_manager.get(question_job_id)
+        question_pending = question_job is not None and not question_job.done
+
+        @st.fragment(run_every=POLL_SECONDS if question_pending else None)
+        def wait_for_answer():
+            if question_pending and question_job.done:
+                st.rerun()
+            if question_pending:
+                st.info("⏳ Thinking...")
 
-            result = financial_trading_crew.kickoff(inputs=full_inputs)
+        wait_for_answer()
+        if question_pending:
+            st.stop()
 
-            st.session_state.chat_history.append(("User", user_query))
-            st.session_state.chat_history.append(("AI", result))
+        del st.session_state.financial_question_job
+        if question_job is None or question_job.status == "failed":
+            st.error(f"❌ Error answering question: {question_job.error if question_job else 'job expired'}")
+        else:
+            st.session_state.chat_history.append(("User", question))
+            st.session_state.chat_history.append(("AI", question_job.result))
 
             st.success("Response received!")
+            display_chat_history()
             feedback = st.radio("Was the answer helpful?", ["Yes", "No"], horizontal=True)
             if feedback:
                 st.write(f"Thanks for your feedback: {feedback}")
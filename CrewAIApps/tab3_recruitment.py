@@ -1,29 +1,8 @@
-import streamlit as st
-from recruitment.crew import RecruitmentCrew
-
-def build_job_yaml(title, description, responsibilities, requirements, preferred_qualifications, perks_and_benefits):
-    return f"""
-        job_requirement:
-          title: >
-            {title}
-          description: >
-            {description}
-          responsibilities: >
-            {responsibilities}
-          requirements: >
-            {requirements}
-          preferred_qualifications: >
-            {preferred_qualifications}
-          perks_and_benefits: >
-            {perks_and_benefits}
-    """
-
-def run_recruitment_ai(job_yaml: str):
-    inputs = {"job_requirements": job_yaml}
-    crew = RecruitmentCrew().crew()
-    return crew.kickoff(inputs=inputs)
-
 def render_tab3():
+    import time
+    import streamlit as st
+    from recruitment.requisition import REQUISITION_FIELDS, JobRequisition
+
     st.title("🤖 Recruitment Assistant")
     st.markdown("Use autonomous AI agents to streamline your hiring process.")
 
@@ -91,16 +70,80 @@ def render_tab3():
 
 
     if submitted:
-        job_yaml = build_job_yaml(
+        requisition = JobRequisition.from_dict(dict(zip(REQUISITION_FIELDS, (
             title, description, responsibilities,
             requirements, preferred_qualifications, perks_and_benefits
-        )
+        ))))
 
         with st.spinner("⏳ Running recruitment agents..."):
             try:
-                result = run_recruitment_ai(job_yaml)
-                st.success("🎉 Recruitment process completed!")
+                # crewai, langchain and selenium load on the first run, not with the form.
+                from recruitment.context_reduction import reduction_stats
+                from recruitment.runner import run_recruitment_ai
+                from recruitment.tools.waits import ready_timings
+                from services.scrape_backend import get_scrape_backend
+                from services.search_gateway import get_search_gateway
+
+                result, timeline, cached = run_recruitment_ai(requisition)
+                st.success("🎉 Recruitment process completed!" + (" (served from cache)" if cached else ""))
                 st.subheader("📋 AI Generated Candidate Report")
                 st.markdown(result)
+                stats = timeline.stats()
+                with st.expander("⏱️ Task timings"):
+                    st.caption(
+                        f"Wall clock {stats['wall_seconds']}s for {stats['task_seconds']}s of task time "
+                        f"({stats['overlap_seconds']}s overlapped)"
+                    )
+                    st.table(timeline.rows())
+                    reduction = reduction_stats.last()
+                    if reduction and not cached:
+                        st.caption(f"Report context: {reduction[0]} → {reduction[1]} tokens")
+                    waits = ready_timings.stats()
+                    if waits["pages"]:
+                        st.caption(
+                            f"Browser waits: {waits['pages']} pages ready in {waits['avg_ready_seconds']}s on average, "
+                            f"{waits['saved_seconds']}s saved over fixed sleeps, {waits['timeouts']} timeouts"
+                        )
+                    search_stats = get_search_gateway().stats()
+                    scrape_stats = get_scrape_backend().stats()
+                    st.caption(
+                        f"Search: {search_stats['hits']} cache hits, {search_stats['coalesced']} coalesced, "
+                        f"{search_stats['network_calls']} API calls (p95 {search_stats['latency_p95_ms']:.0f} ms). "
+                        f"Pages: {scrape_stats['fresh_hits']} fresh hits, {scrape_stats['revalidated']} revalidated, "
+                        f"{scrape_stats['downloads']} downloads, {scrape_stats['errors']} errors"
+                    )
             except Exception as e:
                 st.error(f"❌ Error running recruitment crew: {e}")
+
+    st.divider()
+    st.subheader("Batch Requisitions")
+    upload = st.file_uploader(
+        "Upload a YAML or CSV of job requisitions (one column or key per job section)",
+        type=["yaml", "yml", "csv"],
+    )
+    if upload is not None and st.button("Run Batch"):
+        from recruitment.batch import REPORTS_DIR, RecruitmentBatch, load_requisitions
+
+        try:
+            requisitions = load_requisitions(upload.getvalue(), upload.name)
+        except Exception as e:
+            st.error(f"❌ Could not read requisitions: {e}")
+            return
+        if not requisitions:
+            st.warning("No requisitions with a title found in the upload.")
+            return
+
+        batch = RecruitmentBatch(requisitions, REPORTS_DIR / time.strftime("batch-%Y%m%d-%H%M%S"))
+        progress = st.progress(0.0, text=f"0/{len(requisitions)} requisitions")
+        for done, outcome in enumerate(batch.run(), start=1):
+            progress.progress(done / len(requisitions), text=f"{done}/{len(requisitions)} requisitions")
+            icon = "✅" if outcome["status"] == "done" else "❌"
+            with st.expander(f"{icon} {outcome['title']} ({outcome['stages']['total']}s)"):
+                st.markdown(outcome.get("result") or outcome.get("error"))
+
+        summary = batch.stats.summary()
+        st.success(
+            f"🎉 {summary['completed']} done, {summary['failed']} failed in {summary['wall_seconds']}s "
+            f"({summary['requisitions_per_hour']} requisitions/hour). Reports in {batch.out_dir}"
+        )
+        st.table([{"stage": stage, **latency} for stage, latency in summary["stages"].items()])
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The app is run from CrewAIApps/ (streamlit run crewapp.py), so its modules import from there.
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,34 @@
+import sqlite3
+
+from recruitment.candidate_store import CandidateStore
+
+PEOPLE = [
+    {"name": "Jane Doe", "position": "Rails Engineer", "location": "Berlin",
+     "profile_link": "https://www.linkedin.com/in/jane-doe"},
+    {"name": "Ravi Kumar", "position": "Backend Engineer", "location": "Lisbon",
+     "profile_link": "https://www.linkedin.com/in/ravikumar"},
+]
+
+
+def test_search_replays_in_order(tmp_path):
+    store = CandidateStore(tmp_path / "candidates.sqlite3")
+    store.upsert(PEOPLE, "ruby, rails")
+    store.record_search("rails, ruby", list(reversed(PEOPLE)))
+    replay = store.search_results("Ruby,Rails")
+    assert [person["name"] for person in replay] == ["Ravi Kumar", "Jane Doe"]
+
+
+def test_zero_result_search_survives_a_restart(tmp_path):
+    path = tmp_path / "candidates.sqlite3"
+    CandidateStore(path).record_search("cobol, fortran", [])
+    reopened = CandidateStore(path)
+    assert reopened.is_fresh_search("cobol, fortran")
+    assert reopened.search_results("cobol, fortran") == []
+
+
+def test_search_logged_without_its_results_is_dropped(tmp_path):
+    path = tmp_path / "candidates.sqlite3"
+    CandidateStore(path)
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO searches (query, searched_at, results) VALUES ('rails', strftime('%s','now'), 3)")
+    assert not CandidateStore(path).is_fresh_search("rails")
@@ -0,0 +1,56 @@
+from recruitment.context_reduction import extract_candidates, extract_templates, reduce_context
+
+RESEARCH = """## Ranked Candidates
+
+1. **Jane Doe** - Senior Data Engineer at Acme
+   - Profile: https://www.linkedin.com/in/jane-doe-123/
+   - Position: Senior Data Engineer
+   - Match score: 87/100
+   - Skills: Python, Spark, Airflow
+
+2. **Ravi Kumar** (Data Platform Lead)
+   - Profile: https://linkedin.com/in/ravikumar
+   - Skills: Kafka, Scala
+
+## Outreach Methods
+
+Reach out on LinkedIn first, then follow up by email after three days.
+
+## Personalized LinkedIn Message
+
+Hi Jane, I came across your work on Airflow pipelines and would love to chat.
+
+### Template 1: Initial LinkedIn note
+Hi {name}, your background in {skill} stood out to us.
+"""
+
+MATCHING = """Alex Smith
+Position: Analytics Engineer
+Rating: 4.5 out of 5
+
+Next Steps
+Schedule interviews with the top two candidates.
+"""
+
+
+def test_headings_are_not_candidates():
+    candidates = extract_candidates([RESEARCH, MATCHING])
+    names = sorted(candidate["name"] for candidate in candidates.values())
+    assert names == ["Alex Smith", "Jane Doe", "Ravi Kumar"]
+
+
+def test_candidate_fields():
+    candidates = {c["name"]: c for c in extract_candidates([RESEARCH, MATCHING]).values()}
+    jane = candidates["Jane Doe"]
+    assert jane["link"] == "https://www.linkedin.com/in/jane-doe-123"
+    assert jane["position"] == "Senior Data Engineer"
+    assert jane["score"] == 87
+    assert candidates["Ravi Kumar"]["skills"] == "Kafka, Scala"
+    assert candidates["Alex Smith"]["score"] == 90
+
+
+def test_templates_and_reduced_context():
+    assert extract_templates([RESEARCH])["1"][0] == "Initial LinkedIn note"
+    reduced = reduce_context([RESEARCH, MATCHING])
+    assert reduced.splitlines()[1].startswith("- Alex Smith")
+    assert "Outreach Methods" not in reduced and "Ranked Candidates" not in reduced
@@ -0,0 +1,32 @@
+import threading
+import time
+
+from services.crew_registry import CrewRegistry
+
+
+class Template:
+    def copy(self):
+        return Template()
+
+
+def test_concurrent_first_requests_build_the_template_once():
+    registry = CrewRegistry()
+    builds = []
+    start = threading.Barrier(8)
+
+    def factory():
+        builds.append(1)
+        time.sleep(0.05)
+        return Template()
+
+    def request():
+        start.wait()
+        registry.get("docs", factory)
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(builds) == 1
+    assert registry.stats()["docs"]["requests"] == 8
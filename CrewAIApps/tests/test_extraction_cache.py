@@ -0,0 +1,38 @@
+from chatbot.extraction_cache import ExtractionCache
+
+
+def pages(count, calls):
+    def produce(data):
+        calls.append(data)
+        for number in range(1, count + 1):
+            yield f"page {number}", "text " * 20
+    return produce
+
+
+def test_sequence_is_replayed_from_disk_after_a_restart(tmp_path):
+    calls = []
+    first = list(ExtractionCache(disk_dir=tmp_path).iter_through("pdf", b"doc", pages(5, calls)))
+    reopened = ExtractionCache(disk_dir=tmp_path)
+    assert list(reopened.iter_through("pdf", b"doc", pages(5, calls))) == first
+    assert len(calls) == 1
+    assert reopened.stats()["disk_hits"] == 1
+
+
+def test_abandoned_sequence_is_not_stored(tmp_path):
+    calls = []
+    cache = ExtractionCache(disk_dir=tmp_path)
+    stream = cache.iter_through("pdf", b"doc", pages(5, calls))
+    next(stream)
+    stream.close()
+    assert len(list(cache.iter_through("pdf", b"doc", pages(5, calls)))) == 5
+    assert len(calls) == 2
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_large_sequences_stay_out_of_memory(tmp_path):
+    calls = []
+    cache = ExtractionCache(disk_dir=tmp_path, max_entry_bytes=500)
+    list(cache.iter_through("pdf", b"doc", pages(50, calls)))
+    assert cache.stats()["entries"] == 0
+    assert len(list(cache.iter_through("pdf", b"doc", pages(50, calls)))) == 50
+    assert len(calls) == 1
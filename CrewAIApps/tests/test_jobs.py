@@ -0,0 +1,44 @@
+import threading
+
+from financial.jobs import JobManager
+from financial.result_store import ResultStore
+
+
+class FakeCrew:
+    def __init__(self, release=None, result="done"):
+        self.release = release
+        self.result = result
+        self.task_callback = None
+
+    def kickoff(self, inputs):
+        if self.release is not None:
+            self.release.wait(5)
+        return self.result
+
+
+def test_followups_do_not_queue_behind_analyses():
+    manager = JobManager(max_workers=1, followup_workers=1)
+    release = threading.Event()
+    analysis = manager.submit(FakeCrew(release), {})
+    followup = manager.submit_followup(FakeCrew(result="answer"), {})
+    assert followup.wait(5) and followup.result == "answer"
+    assert not analysis.done
+    release.set()
+    assert analysis.wait(5)
+
+
+def test_superseded_queued_analysis_is_cancelled_and_resubmitted():
+    manager = JobManager(max_workers=1)
+    store = ResultStore()
+    release = threading.Event()
+    running = store.get_or_submit({"stock_selection": "AAPL"}, lambda: manager.submit(FakeCrew(release), {}))
+    queued = store.get_or_submit({"stock_selection": "NVDA"}, lambda: manager.submit(FakeCrew(), {}))
+
+    assert manager.cancel(queued.id)
+    assert queued.done and queued.status == "cancelled"
+    assert not manager.cancel(running.id)
+
+    again = store.get_or_submit({"stock_selection": "NVDA"}, lambda: manager.submit(FakeCrew(), {}))
+    assert again is not queued
+    release.set()
+    assert again.wait(5) and again.status == "done"
@@ -0,0 +1,46 @@
+from services.llm_cache import LLMResponseCache, request_key
+
+SCOPE = "gpt-4:0.7"
+REPORT = "Quarterly report. " + " ".join(f"Segment {i} revenue grew {i % 7} percent." for i in range(400))
+
+
+def make_cache(**kwargs):
+    return LLMResponseCache(":memory:", semantic=True, **kwargs)
+
+
+def ask(cache, context, question, answer=None):
+    key = request_key("gpt-4", 0.7, [context, question])
+    if answer is None:
+        return cache.lookup(key, SCOPE, context, question)
+    cache.put(key, SCOPE, context, question, answer, 1.0)
+
+
+def test_exact_hit():
+    cache = make_cache()
+    ask(cache, REPORT, "What was total revenue?", "42")
+    assert ask(cache, REPORT, "What was total revenue?") == ("42", "exact")
+
+
+def test_shared_context_different_question_is_a_miss():
+    cache = make_cache()
+    ask(cache, REPORT, "What was total revenue?", "42")
+    assert ask(cache, REPORT, "Which segment shrank the most?") == (None, None)
+
+
+def test_rephrased_question_same_context_is_a_semantic_hit():
+    cache = make_cache()
+    ask(cache, REPORT, "What was total revenue?", "42")
+    assert ask(cache, REPORT, "what was total revenue") == ("42", "semantic")
+
+
+def test_same_question_different_context_is_a_miss():
+    cache = make_cache()
+    ask(cache, REPORT, "What was total revenue?", "42")
+    assert ask(cache, REPORT + " Restated.", "what was total revenue") == (None, None)
+
+
+def test_long_question_is_matched_exactly_only():
+    cache = make_cache(max_question_chars=200)
+    ask(cache, "", REPORT + " What was total revenue?", "42")
+    assert ask(cache, "", REPORT + " Which segment shrank the most?") == (None, None)
+    assert cache.stats()["misses"] == 1
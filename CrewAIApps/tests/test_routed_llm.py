@@ -0,0 +1,61 @@
+import pytest
+
+crewai = pytest.importorskip("crewai")
+
+from services.llm_cache import LLMResponseCache  # noqa: E402
+from services.model_router import ModelRouter  # noqa: E402
+from services.routed_llm import RoutedLLM, split_messages  # noqa: E402
+
+
+class FakeLLM(crewai.BaseLLM):
+    calls: list = []
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None,
+             response_model=None, **kwargs):
+        self.calls.append(messages)
+        return "Thought: I now know the final answer\nFinal Answer: 42"
+
+
+@pytest.fixture
+def router():
+    return ModelRouter({"test": {"model": "fake-primary", "fallback": None}}, {})
+
+
+@pytest.fixture
+def fake():
+    return FakeLLM(model="fake-primary", calls=[])
+
+
+def test_agent_call_reaches_the_router(monkeypatch, router, fake):
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "true")
+    llm = RoutedLLM(route="test", router=router, factory=lambda model: fake)
+    agent = crewai.Agent(role="Analyst", goal="Answer", backstory="Terse.", llm=llm)
+    assert agent.llm is llm
+
+    task = crewai.Task(description="What is six times seven?", expected_output="A number", agent=agent)
+    output = crewai.Crew(agents=[agent], tasks=[task]).kickoff()
+
+    assert "42" in output.raw
+    assert fake.calls
+    assert router.stats()["test"]["models"]["fake-primary"]["count"] == len(fake.calls)
+
+
+def test_cache_hits_skip_the_model_and_the_router(router, fake):
+    cache = LLMResponseCache(":memory:")
+    llm = RoutedLLM(route="test", router=router, factory=lambda model: fake, cache=cache, bypass=False)
+    messages = [{"role": "system", "content": "Be terse."}, {"role": "user", "content": "Six times seven?"}]
+
+    assert llm.call(messages) == llm.call(messages)
+    assert len(fake.calls) == 1
+    assert router.stats()["test"]["models"]["fake-primary"]["count"] == 1
+    assert cache.stats()["exact_hits"] == 1
+
+
+def test_split_messages_takes_the_last_user_message_as_the_question():
+    context, question = split_messages([
+        {"role": "system", "content": "Be terse."},
+        {"role": "user", "content": "Six times seven?"},
+    ])
+    assert question == "Six times seven?"
+    assert "Be terse." in context and "Six times seven?" not in context
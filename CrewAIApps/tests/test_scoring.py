@@ -0,0 +1,34 @@
+from recruitment.scoring import rank_candidates, score_candidates
+
+JOB = {
+    "title": "Ruby on Rails Engineer",
+    "description": "Build high-quality, scalable web applications for our customers.",
+    "requirements": "- Ruby on Rails, React, PostgreSQL.",
+}
+
+
+def pool():
+    return [
+        {"name": "Full Match", "position": "Rails Engineer", "skills": "ruby, rails, react, postgresql"},
+        {"name": "Half Match", "position": "Backend Engineer", "skills": "ruby, rails, java, go"},
+        {"name": "No Match", "position": "Data Scientist", "skills": "python, pandas, spark, sql"},
+        {"name": "Other", "position": "Designer", "skills": "figma, sketch, css, html"},
+    ]
+
+
+def test_best_candidate_scores_near_the_top_of_the_scale():
+    scores = score_candidates(JOB, pool())
+    assert scores[0] >= 80
+    assert scores[0] > scores[1] > scores[2] == 0
+    assert all(0 <= score <= 100 for score in scores)
+
+
+def test_terms_nobody_has_do_not_lower_scores():
+    plain = score_candidates({"requirements": JOB["requirements"], "title": JOB["title"]}, pool())
+    with_boilerplate = score_candidates(JOB, pool())
+    assert abs(float(plain[0]) - float(with_boilerplate[0])) < 1e-3
+
+
+def test_rank_candidates_best_first():
+    ranked = rank_candidates(JOB, pool(), top_n=2)
+    assert [candidate["name"] for _, candidate in ranked] == ["Full Match", "Half Match"]
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("langchain.tools")
+
+from services.scrape_backend import ScrapeBackend  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode()
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Answers conditional GETs with 304, everything else with the page."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, b"<html><body><p>Quarterly results</p></body></html>", {"ETag": '"v1"'})
+
+
+def make_backend():
+    backend = ScrapeBackend(fresh_seconds=0)
+    backend.session = FakeSession()
+    return backend
+
+
+def test_revalidated_page_is_served_from_cache():
+    backend = make_backend()
+    assert backend.fetch("https://example.com") == "Quarterly results"
+    assert backend.fetch("https://example.com") == "Quarterly results"
+    assert backend.stats()["revalidated"] == 1
+    assert backend.stats()["downloads"] == 1
+
+
+def test_304_after_the_text_was_evicted_refetches_the_page():
+    backend = make_backend()
+    backend.fetch("https://example.com")
+    real_get = backend.session.get
+
+    def get_then_evict(url, headers=None, timeout=None):
+        response = real_get(url, headers, timeout)
+        backend._texts.clear()  # evicted by another thread while the request was in flight
+        return response
+
+    backend.session.get = get_then_evict
+    assert backend.fetch("https://example.com") == "Quarterly results"
+    assert backend.session.requests[-1] == {}
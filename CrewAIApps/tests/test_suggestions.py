@@ -0,0 +1,36 @@
+import threading
+
+from services.suggestions import SuggestionCache
+
+
+def test_get_or_prefetch_never_blocks_and_counts_misses():
+    cache = SuggestionCache()
+    release = threading.Event()
+
+    def generate(context):
+        release.wait(5)
+        return ["Q1?", "Q2?"]
+
+    assert cache.get_or_prefetch("trading", "AAPL", generate) is None
+    assert cache.get_or_prefetch("trading", "AAPL", generate) is None
+    future = next(iter(cache._inflight.values()))
+    release.set()
+    future.result(5)
+    assert cache.get_or_prefetch("trading", "AAPL", generate) == ["Q1?", "Q2?"]
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_failed_generation_is_not_retried_straight_away():
+    cache = SuggestionCache()
+    calls = []
+
+    def generate(context):
+        calls.append(context)
+        raise RuntimeError("rate limited")
+
+    future = cache.prefetch("trading", "AAPL", generate)
+    assert future.exception(5) is not None
+    assert cache.prefetch("trading", "AAPL", generate) is None
+    assert cache.get_or_prefetch("trading", "AAPL", generate) is None
+    assert calls == ["AAPL"]
@@ -0,0 +1,51 @@
+import numpy as np
+
+from chatbot.vector_index import APPROX_MIN_ROWS, DocumentIndex
+
+DIM = 128
+K = 5
+
+
+def clustered(rows, clusters=200, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, DIM)).astype(np.float32)
+    labels = rng.integers(0, clusters, rows)
+    return centres[labels] + 0.5 * rng.standard_normal((rows, DIM)).astype(np.float32)
+
+
+def make_index(matrix):
+    kinds = ["pdf", "csv"]
+    passages = [{"file": "doc", "kind": kinds[row % 2], "locator": f"row {row}", "text": ""} for row in range(len(matrix))]
+    return DocumentIndex(passages, matrix)
+
+
+def exact_top(index, query, k, kinds=None):
+    rows = [row for row, passage in enumerate(index.passages) if not kinds or passage["kind"] in kinds]
+    query = query / np.linalg.norm(query)
+    scores = index.matrix[rows] @ query
+    return {index.passages[rows[i]]["locator"] for i in np.argsort(-scores)[:k]}
+
+
+def recall(index, queries, kinds=None):
+    found = 0
+    for query in queries:
+        approx = {passage["locator"] for _, passage in index.search(query, K, kinds)}
+        found += len(approx & exact_top(index, query, K, kinds))
+    return found / (K * len(queries))
+
+
+def test_lsh_is_used_and_recalls_most_exact_neighbours():
+    matrix = clustered(APPROX_MIN_ROWS * 2)
+    index = make_index(matrix)
+    assert index._approx is not None
+    rng = np.random.default_rng(1)
+    queries = matrix[rng.integers(0, len(matrix), 100)] + 0.1 * rng.standard_normal((100, DIM)).astype(np.float32)
+    assert recall(index, queries) >= 0.85
+    assert recall(index, queries, kinds={"csv"}) >= 0.85
+
+
+def test_small_documents_use_exact_search():
+    matrix = clustered(200)
+    index = make_index(matrix)
+    assert index._approx is None
+    assert recall(index, matrix[:20]) == 1.0